@@ -1,16 +1,49 @@
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
-from eth_utils import add_0x_prefix
 from ledgerblue.comm import getDongle
 from ledgerblue.commException import CommException
 from ledgerblue.Dongle import Dongle
 
-from ledgereth.constants import DEFAULT_PATH_ENCODED
+from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_PATH_LC, DEFAULT_PATH_PAYLOAD
 from ledgereth.exceptions import LedgerError
 from ledgereth.objects import ISO7816Command
 
-DONGLE_CACHE: Optional[Dongle] = None
-DONGLE_CONFIG_CACHE: Optional[bytes] = None
+# Per-thread scratch buffer for APDU encoding.  Sized for a 4-byte header, Lc,
+# a full data chunk, and Le.
+_APDU_BUFFER = threading.local()
+_APDU_BUFFER_SIZE = 4 + 1 + DATA_CHUNK_SIZE + 1
+
+
+def encode_apdu(
+    header: bytes,
+    data: bytes,
+    Lc: Optional[bytes] = None,
+    Le: Optional[bytes] = None,
+) -> bytes:
+    """Encode an APDU from a CLA + INS + P1 + P2 header and its data.  Lc
+    defaults to the length of data."""
+    if Lc is None:
+        Lc = len(data).to_bytes(1, "big")
+
+    buf = getattr(_APDU_BUFFER, "buf", None)
+
+    if buf is None:
+        buf = _APDU_BUFFER.buf = bytearray(_APDU_BUFFER_SIZE)
+
+    lc_start = len(header)
+    data_start = lc_start + len(Lc)
+    end = data_start + len(data)
+
+    buf[:lc_start] = header
+    buf[lc_start:data_start] = Lc
+    buf[data_start:end] = data
+
+    if Le:
+        buf[end : end + len(Le)] = Le
+        end += len(Le)
+
+    return bytes(memoryview(buf)[:end])
 
 
 class LedgerCommands:
@@ -33,7 +66,8 @@ class LedgerCommands:
         INS=b"\x02",
         P1=b"\x00",  # 0x00 - Return addres | 0x01 - Confirm befor ereturning
         P2=b"\x00",  # 0x00 - No chain code | 0x01 - With chain code
-        data=(len(DEFAULT_PATH_ENCODED) // 4).to_bytes(1, "big") + DEFAULT_PATH_ENCODED,
+        Lc=DEFAULT_PATH_LC,
+        data=DEFAULT_PATH_PAYLOAD,
     )
 
     GET_ADDRESS_NO_CONFIRM = ISO7816Command(
@@ -78,26 +112,67 @@ class LedgerCommands:
         P2=b"\x00",
     )
 
-    @staticmethod
-    def get(name: str) -> bytes:
-        if not hasattr(LedgerCommands, name):
-            raise ValueError("Command not available")
-        cmd = getattr(LedgerCommands, name)
-        return cmd.encode()
+    #: All available commands by name
+    _BY_NAME: Dict[str, ISO7816Command]
+
+    #: Pre-encoded APDUs for commands sent without additional data
+    _ENCODED: Dict[str, bytes]
 
-    @staticmethod
+    #: Read-only views over the pre-encoded APDUs
+    _ENCODED_MV: Dict[str, memoryview]
+
+    #: CLA + INS + P1 + P2 header for each command
+    _HEADER: Dict[str, bytes]
+
+    @classmethod
+    def get(cls, name: str) -> bytes:
+        try:
+            return cls._ENCODED[name]
+        except KeyError:
+            raise ValueError("Command not available") from None
+
+    @classmethod
+    def get_mv(cls, name: str) -> memoryview:
+        """Return a read-only view of a pre-encoded command.  Useful for
+        transports that accept any buffer-protocol object without copying."""
+        try:
+            return cls._ENCODED_MV[name]
+        except KeyError:
+            raise ValueError("Command not available") from None
+
+    @classmethod
     def get_with_data(
-        name: str, data: bytes, Lc: Optional[bytes] = None, Le: Optional[bytes] = None
+        cls,
+        name: str,
+        data: bytes,
+        Lc: Optional[bytes] = None,
+        Le: Optional[bytes] = None,
     ) -> bytes:
-        if not hasattr(LedgerCommands, name):
-            raise ValueError("Command not available")
-        cmd = getattr(LedgerCommands, name)
-        cmd.set_data(data)
-        if Lc is not None:
-            cmd.Lc = Lc
-        if Le is not None:
-            cmd.Le = Le
-        return cmd.encode()
+        try:
+            header = cls._HEADER[name]
+        except KeyError:
+            raise ValueError("Command not available") from None
+
+        return encode_apdu(header, data, Lc, Le)
+
+
+LedgerCommands._BY_NAME = {
+    name: cmd
+    for name, cmd in vars(LedgerCommands).items()
+    if isinstance(cmd, ISO7816Command)
+}
+# Commands are immutable, so encode them once up front
+LedgerCommands._ENCODED = {
+    name: cmd.encode() for name, cmd in LedgerCommands._BY_NAME.items()
+}
+LedgerCommands._ENCODED_MV = {
+    name: memoryview(encoded).toreadonly()
+    for name, encoded in LedgerCommands._ENCODED.items()
+}
+LedgerCommands._HEADER = {
+    name: cmd.CLA + cmd.INS + cmd.P1 + cmd.P2
+    for name, cmd in LedgerCommands._BY_NAME.items()
+}
 
 
 def dongle_send(dongle: Dongle, command_string: str) -> bytes:
@@ -124,63 +199,138 @@ def dongle_send_data(
         raise LedgerError.transalate_comm_exception(err) from err
 
 
+def dongle_send_data_stream(
+    dongle: Dongle,
+    first_command_string: str,
+    secondary_command_string: str,
+    data: bytes,
+) -> bytes:
+    """Send data that may exceed a single APDU to the dongle.  The first chunk
+    is sent with the first command and any remaining chunks with the secondary
+    command.  All APDUs are encoded before the first exchange so they can be
+    sent back-to-back.
+
+    :return: The device response to the final chunk
+    """
+    # Chunks are views into data, copied only once into the APDU buffer
+    mv = memoryview(data)
+    apdus = [
+        LedgerCommands.get_with_data(
+            secondary_command_string if offset else first_command_string,
+            mv[offset : offset + DATA_CHUNK_SIZE],
+        )
+        for offset in range(0, len(mv) or 1, DATA_CHUNK_SIZE)
+    ]
+    retval = b""
+
+    try:
+        for apdu in apdus:
+            retval = dongle.exchange(apdu)
+    except CommException as err:
+        raise LedgerError.transalate_comm_exception(err) from err
+
+    return retval
+
+
 def decode_response_version_from_config(confbytes: bytes) -> str:
     """Decode the string version from the bytearray response from Ledger device"""
-    return "{}.{}.{}".format(
-        confbytes[1],
-        confbytes[2],
-        confbytes[3],
-    )
+    return f"{confbytes[1]}.{confbytes[2]}.{confbytes[3]}"
 
 
 def decode_response_address(response):
     """Decode an address response from the dongle"""
-    offset = 1 + response[0]
-    address_encoded = response[offset + 1 : offset + 1 + response[offset]]
-    return add_0x_prefix(address_encoded.decode("ascii"))
+    mv = memoryview(response)
+    offset = 1 + mv[0]
+    # The device always returns the hex address without a 0x prefix
+    return "0x" + bytes(mv[offset + 1 : offset + 1 + mv[offset]]).decode("ascii")
 
 
 def is_usable_version(confbytes: bytes) -> bool:
     """Only tested since 1.2.4 up to 1.10.0"""
-    version = decode_response_version_from_config(confbytes)
-    v_parts = version.split(".")
-    ver = [int(s) for s in v_parts]
+    major, minor, patch = confbytes[1], confbytes[2], confbytes[3]
 
-    # v9.9.9 is MockLedger
-    if ver[0] == 9:
-        return True
+    # v9.9.9 is MockLedger.  Otherwise, major must be v1 and anything below
+    # v1.2.4 is untested.
+    return major == 9 or (major == 1 and (minor, patch) >= (2, 4))
 
-    # Major must be v1
-    if ver[0] != 1:
-        return False
 
-    # Minor must not be below 2 because untested
-    if ver[1] < 2:
-        return False
+def ensure_usable(dongle: Dongle) -> bytes:
+    """Sanity check the firmware version of the device
 
-    # Patch must not be below 4 if v1.2
-    if ver[1] == 2 and ver[2] < 4:
-        return False
+    :return: The configuration response from the device
+    """
+    config = dongle_send(dongle, "GET_CONFIGURATION")
 
-    return True
+    if not is_usable_version(config):
+        raise NotImplementedError("Unsupported firmware version")
 
+    return config
 
-def init_dongle(dongle: Dongle = None, debug: bool = False) -> Dongle:
-    """Initialize the dongle and sanity check the connection"""
-    global DONGLE_CACHE, DONGLE_CONFIG_CACHE
 
-    # If not given, use cache if available
-    if dongle is None and DONGLE_CACHE is None:
-        try:
-            DONGLE_CACHE = getDongle(debug)
-        except CommException as err:
-            raise LedgerError.transalate_comm_exception(err) from err
+class LedgerSession:
+    """Connection state for a single Ledger device.  The dongle is opened on
+    first use and its firmware version is only checked once."""
+
+    __slots__ = ("dongle", "config")
+
+    #: The connected dongle, if any
+    dongle: Optional[Dongle]
+
+    #: The GET_CONFIGURATION response, once the firmware is verified
+    config: Optional[bytes]
+
+    def __init__(self, dongle: Optional[Dongle] = None):
+        """Initialize a session
 
-        # Sanity check the version
-        if DONGLE_CONFIG_CACHE is None or dongle is not None:
-            DONGLE_CONFIG_CACHE = dongle_send(DONGLE_CACHE, "GET_CONFIGURATION")
+        :param dongle: (:class:`ledgerblue.Dongle.Dongle`) - An already
+            connected dongle to use for this session
+        """
+        self.dongle = dongle
+        self.config = None
 
-        if not is_usable_version(DONGLE_CONFIG_CACHE):
-            raise NotImplementedError("Unsupported firmware version")
+    def get_dongle(self, debug: bool = False) -> Dongle:
+        """Return the session's dongle, connecting to the device if necessary"""
+        if self.dongle is None:
+            try:
+                self.dongle = getDongle(debug)
+            except CommException as err:
+                raise LedgerError.transalate_comm_exception(err) from err
+
+        return self.dongle
+
+    def ensure(self, debug: bool = False, verify: bool = True) -> Dongle:
+        """Return the session's dongle, checking the firmware version on first
+        use if verify is set"""
+        dongle = self.get_dongle(debug)
+
+        if verify and self.config is None:
+            self.config = ensure_usable(dongle)
+
+        return dongle
+
+
+#: Session used when no dongle is given
+DEFAULT_SESSION = LedgerSession()
+
+
+def get_dongle(debug: bool = False) -> Dongle:
+    """Return the cached dongle, connecting to the device if necessary"""
+    return DEFAULT_SESSION.get_dongle(debug)
+
+
+def init_dongle(
+    dongle: Optional[Dongle] = None, debug: bool = False, verify: bool = True
+) -> Dongle:
+    """Initialize the dongle and sanity check the connection
+
+    :param dongle: (:class:`ledgerblue.Dongle.Dongle`) - Dongle to use.  If not
+        given, the cached dongle is used, connecting if necessary.
+    :param debug: (:code:`bool`) - Enable ledgerblue debug output when
+        connecting
+    :param verify: (:code:`bool`) - Check the firmware version of the cached
+        dongle.  The check only runs once per session.
+    """
+    if dongle is not None:
+        return dongle
 
-    return dongle or DONGLE_CACHE
+    return DEFAULT_SESSION.ensure(debug, verify)
@@ -1,14 +1,22 @@
 import os
-from typing import Any, Dict
+import re
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Plain ASCII decimal integers, which int() always accepts
+_INT_RE = re.compile(r"[+-]?[0-9]+")
 
 
 def getenvint(key, default=0):
     """Get an int from en env var or use default"""
-    try:
-        return int(os.environ.get("MAX_ACCOUNTS_FETCH"))
-    except TypeError:
+    value = os.environ.get(key)
+
+    if value is None:
         return default
 
+    value = value.strip()
+    return int(value) if _INT_RE.fullmatch(value) else default
+
 
 # Chain ID to use if not given by user
 DEFAULT_CHAIN_ID = 1
@@ -30,13 +38,19 @@ if LEGACY_ACCOUNTS:
     DEFAULT_PATH_STRING = "44'/60'/0'/0"
     DEFAULT_PATH_ENCODED = b"\x80\x00\x00,\x80\x00\x00<\x80\x00\x00\x00\x00\x00\x00\x00"
 DEFAULT_PATH = DEFAULT_PATH_ENCODED.hex()
-VRS_RETURN_LENGTH = int(65).to_bytes(1, "big")
+# Default path as sent to the device (prefixed by its element count) and its Lc
+DEFAULT_PATH_PAYLOAD = bytes([len(DEFAULT_PATH_ENCODED) // 4]) + DEFAULT_PATH_ENCODED
+DEFAULT_PATH_LC = bytes([len(DEFAULT_PATH_PAYLOAD)])
+# 65 bytes
+VRS_RETURN_LENGTH = b"\x41"
 
 # Data size expected from Ledger
 DATA_CHUNK_SIZE = 255
 
 # Default "zero" values in EVM/Solidity
-DEFAULTS: Dict[type, Any] = {
-    int: 0,
-    bytes: b"",
-}
+DEFAULTS: Mapping[type, Any] = MappingProxyType(
+    {
+        int: 0,
+        bytes: b"",
+    }
+)
@@ -2,13 +2,16 @@ import binascii
 import struct
 from typing import Optional, Union
 
-from ledgereth.comms import Dongle, dongle_send_data, init_dongle
-from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_CHAIN_ID, DEFAULT_PATH_STRING
+from ledgereth.comms import (
+    Dongle,
+    dongle_send_data,
+    dongle_send_data_stream,
+    init_dongle,
+)
+from ledgereth.constants import DEFAULT_CHAIN_ID, DEFAULT_PATH_STRING
 from ledgereth.objects import SignedMessage, SignedTypedMessage
 from ledgereth.utils import (
-    chunks,
     coerce_access_list,
-    is_bip32_path,
     is_hex_string,
     parse_bip32_path,
 )
@@ -34,7 +37,6 @@ def sign_message(
     """
     given_dongle = dongle is not None
     dongle = init_dongle(dongle)
-    retval = None
 
     if type(message) == str:
         message = message.encode("utf-8")
@@ -42,34 +44,25 @@ def sign_message(
     # Silence mypy due to type cohersion above
     assert isinstance(message, bytes)
 
-    encoded = struct.pack(">I", len(message))
-    encoded += message
-
-    if not is_bip32_path(sender_path):
-        raise ValueError("Invalid sender BIP32 path given to sign_transaction")
-
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + encoded
-
-    chunk_count = 0
-    for chunk in chunks(payload, DATA_CHUNK_SIZE):
-        chunk_size = len(chunk)
-
-        if chunk_count == 0:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_MESSAGE_FIRST_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        else:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_MESSAGE_SECONDARY_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        chunk_count += 1
+    try:
+        path = parse_bip32_path(sender_path)
+    except ValueError:
+        raise ValueError(
+            "Invalid sender BIP32 path given to sign_transaction"
+        ) from None
+
+    payload = b"".join(
+        (
+            (len(path) // 4).to_bytes(1, "big"),
+            path,
+            struct.pack(">I", len(message)),
+            message,
+        )
+    )
+
+    retval = dongle_send_data_stream(
+        dongle, "SIGN_MESSAGE_FIRST_DATA", "SIGN_MESSAGE_SECONDARY_DATA", payload
+    )
 
     if retval is None or len(retval) < 64:
         raise Exception("Invalid response from Ledger")
@@ -128,13 +121,16 @@ def sign_typed_data_draft(
     assert isinstance(domain_hash, bytes)
     assert isinstance(message_hash, bytes)
 
-    encoded = domain_hash + message_hash
-
-    if not is_bip32_path(sender_path):
-        raise ValueError("Invalid sender BIP32 path given to sign_transaction")
+    try:
+        path = parse_bip32_path(sender_path)
+    except ValueError:
+        raise ValueError(
+            "Invalid sender BIP32 path given to sign_transaction"
+        ) from None
 
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + encoded
+    payload = b"".join(
+        ((len(path) // 4).to_bytes(1, "big"), path, domain_hash, message_hash)
+    )
 
     retval = dongle_send_data(
         dongle,
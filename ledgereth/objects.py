@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from eth_utils import encode_hex, to_checksum_address
-from rlp import Serializable, decode, encode
+from eth_utils import to_checksum_address
+from rlp import DeserializationError, Serializable, decode, encode
 from rlp.sedes import BigEndianInt, Binary, CountableList
 from rlp.sedes import List as ListSedes
 from rlp.sedes import big_endian_int, binary
@@ -13,7 +14,6 @@ from rlp.sedes import big_endian_int, binary
 from ledgereth.constants import DEFAULT_CHAIN_ID
 from ledgereth.utils import (
     coerce_list_types,
-    is_bip32_path,
     is_bytes,
     is_optional_bytes,
     parse_bip32_path,
@@ -29,6 +29,45 @@ access_list_sede_type = CountableList(
         ]
     ),
 )
+
+# Fields shared between the unsigned and signed form of each transaction type
+LEGACY_TX_FIELDS = [
+    ("nonce", big_endian_int),
+    ("gas_price", big_endian_int),
+    ("gas_limit", big_endian_int),
+    ("destination", address_allow_empty),
+    ("amount", big_endian_int),
+    ("data", binary),
+]
+TYPE1_TX_FIELDS = [
+    ("chain_id", big_endian_int),
+    ("nonce", big_endian_int),
+    ("gas_price", big_endian_int),
+    ("gas_limit", big_endian_int),
+    ("destination", address_allow_empty),
+    ("amount", big_endian_int),
+    ("data", binary),
+    ("access_list", access_list_sede_type),
+]
+TYPE2_TX_FIELDS = [
+    ("chain_id", big_endian_int),
+    ("nonce", big_endian_int),
+    ("max_priority_fee_per_gas", big_endian_int),
+    ("max_fee_per_gas", big_endian_int),
+    ("gas_limit", big_endian_int),
+    ("destination", address_allow_empty),
+    ("amount", big_endian_int),
+    ("data", binary),
+    ("access_list", access_list_sede_type),
+]
+# Empty values that follow chain_id in an EIP-155 signing pre-image
+EIP155_TRAILER = (b"", b"")
+TYPED_TX_SIGNATURE_FIELDS = [
+    ("y_parity", big_endian_int),
+    ("sender_r", big_endian_int),
+    ("sender_s", big_endian_int),
+]
+
 RPC_TX_PROP_TRANSLATION = {
     "gas_price": "gasPrice",
     "gas_limit": "gas",
@@ -39,20 +78,21 @@ RPC_TX_PROP_TRANSLATION = {
     "access_list": "accessList",
     "chain_id": "chainId",
 }
-RPC_TX_PROPS = [
-    "chainId",
-    "from",
-    "to",
-    "gas",
-    "gasPrice",
-    "value",
-    "data",
-    "nonce",
-    "maxFeePerGas",
-    "maxPriorityFeePerGas",
-    "chainId",
-    "accessList",
-]
+RPC_TX_PROPS = frozenset(
+    [
+        "chainId",
+        "from",
+        "to",
+        "gas",
+        "gasPrice",
+        "value",
+        "data",
+        "nonce",
+        "maxFeePerGas",
+        "maxPriorityFeePerGas",
+        "accessList",
+    ]
+)
 MAX_LEGACY_CHAIN_ID = 0xFFFFFFFF + 1
 MAX_CHAIN_ID = 0x38D7EA4C67FFF
 
@@ -69,13 +109,18 @@ class TransactionType(IntEnum):
 
     def to_byte(self):
         """Decode TransactionType to a single byte"""
-        return self.value.to_bytes(1, "big")
+        return _TRANSACTION_TYPE_BYTES[self]
+
+
+_TRANSACTION_TYPE_BYTES = {t: bytes([t.value]) for t in TransactionType}
 
 
 class ISO7816Command:
     """A representation of an ISO-7816 APDU Command binary to be sent to the
     Ledger device."""
 
+    __slots__ = ("CLA", "INS", "P1", "P2", "Lc", "Le", "data", "_encoded")
+
     def __init__(
         self,
         CLA: bytes,
@@ -101,10 +146,24 @@ class ISO7816Command:
         self.INS = INS
         self.P1 = P1
         self.P2 = P2
-        self.Lc = Lc or b"\x00" if not data else len(data).to_bytes(1, "big")
+
+        if Lc is not None:
+            self.Lc = Lc
+        elif data is not None:
+            self.Lc = len(data).to_bytes(1, "big")
+        else:
+            self.Lc = b"\x00"
+
         self.Le = Le
         self.data = data
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # Any change to the command parts invalidates the memoized encoding
+        if name != "_encoded":
+            super().__setattr__("_encoded", None)
+
     def set_data(self, data: bytes, Lc: Optional[bytes] = None) -> None:
         """Set the command data and its length
 
@@ -128,18 +187,24 @@ class ISO7816Command:
 
         :return: Encoded ``bytes`` data
         """
-        encoded = self.CLA + self.INS + self.P1 + self.P2
+        if self._encoded is not None:
+            return self._encoded
+
+        parts = [self.CLA, self.INS, self.P1, self.P2]
 
         if self.data is not None:
             if self.Lc is None:
                 self.Lc = (len(self.data)).to_bytes(1, "big")
-            encoded += self.Lc
-            encoded += self.data
+            parts.append(self.Lc)
+            parts.append(self.data)
         else:
-            encoded += self.Lc
+            parts.append(self.Lc)
 
         if self.Le is not None:
-            encoded += self.Le
+            parts.append(self.Le)
+
+        encoded = b"".join(parts)
+        self._encoded = encoded
 
         return encoded
 
@@ -164,29 +229,85 @@ class LedgerAccount:
     #: The account's address
     address: str
 
+    __slots__ = ("path", "path_encoded", "address", "_hash")
+
     def __init__(self, path, address):
         """Initialize an account.
 
         :param path: (``str``) Derivation path for the account
         :param address: (``str``) Address of the account
         """
-        if not is_bip32_path(path):
-            raise ValueError("Invalid BIP32 Ethereum path")
-
-        self.path = path
         self.path_encoded = parse_bip32_path(path)
+        self.path = path
         self.address = to_checksum_address(address)
+        self._hash = None
 
     def __repr__(self):
         return f"<ledgereth.objects.LedgerAccount {self.address}>"
 
     def __eq__(self, other):
-        if isinstance(other, LedgerAccount):
-            return self.path == other.path and self.address == other.address
-        return False
+        # Exact type check first, only walking the MRO for subclasses
+        if type(other) is not LedgerAccount and not isinstance(other, LedgerAccount):
+            return NotImplemented
+        return self.address == other.address and self.path == other.path
 
     def __hash__(self):
-        return hash((self.path, self.address))
+        # Accounts don't change after init, so the hash only needs computing once
+        if self._hash is None:
+            self._hash = hash((self.path, self.address))
+        return self._hash
+
+
+def _storage_key_hex(slot: Union[bytes, int]) -> str:
+    """Format an access list storage key as a 32-byte hex string"""
+    if isinstance(slot, int):
+        return "0x" + slot.to_bytes(32, "big").hex()
+
+    return "0x" + bytes(slot).hex()
+
+
+def _compile_to_rpc_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a to_rpc_dict function specialized to a transaction class's
+    fields.  The generated function builds the dict in one literal, reading the
+    attributes rlp stores field values in directly.
+
+    :param cls: (``type``) Transaction class to generate the function for
+    :return: to_rpc_dict function
+    """
+    items = []
+
+    for name, attr in zip(cls._meta.field_names, cls._meta.field_attrs):
+        key = RPC_TX_PROP_TRANSLATION.get(name, name)
+
+        if key not in RPC_TX_PROPS:
+            continue
+
+        if key == "accessList":
+            # Need to format an access list differently for web3/RPC-like
+            # objects.  It expects a list of objects, and takes the 32-byte
+            # storage keys as hex strings
+            value = (
+                '[{"address": item[0], "storageKeys": '
+                "[_storage_key_hex(slot) for slot in item[1]]} "
+                f"for item in self.{attr}]"
+            )
+        else:
+            value = f"self.{attr}"
+
+        items.append(f"        {key!r}: {value},\n")
+
+    source = "def to_rpc_dict(self):\n    return {\n" + "".join(items) + "    }\n"
+    namespace: Dict[str, Any] = {"_storage_key_hex": _storage_key_hex}
+    exec(source, namespace)
+
+    func = namespace["to_rpc_dict"]
+    func.__doc__ = SerializableTransaction.to_rpc_dict.__doc__
+    func.__qualname__ = f"{cls.__qualname__}.to_rpc_dict"
+    func.__module__ = cls.__module__
+    # Marks it as safe to replace with one generated for a subclass
+    func._generated = True  # type: ignore[attr-defined]
+
+    return func
 
 
 class SerializableTransaction(Serializable):
@@ -208,44 +329,74 @@ class SerializableTransaction(Serializable):
 
         :return: Transaction dict
         """
-        d = {}
-        for name, _ in self.__class__._meta.fields:
-            d[name] = getattr(self, name)
-        return d
+        names, get_values = self._dict_field_plan()
+        return dict(zip(names, get_values(self)))
+
+    @classmethod
+    def _dict_field_plan(cls) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple]]:
+        """Return the field names and a getter for all of their values at
+        once.  Computed once per class.
+
+        :return: Tuple of field names and a values getter
+        """
+        # Look in the class's own namespace so subclasses get their own plan
+        plan = cls.__dict__.get("_dict_plan")
+
+        if plan is None:
+            # Read the underlying attributes rlp stores values in, skipping
+            # the per-field property lookups
+            attrs = cls._meta.field_attrs
+
+            if len(attrs) > 1:
+                get_values = attrgetter(*attrs)
+            else:
+                # attrgetter() gives a bare value for one attribute, and needs
+                # at least one
+                getters = tuple(attrgetter(attr) for attr in attrs)
+
+                def get_values(obj):
+                    return tuple(get(obj) for get in getters)
+
+            plan = (cls._meta.field_names, get_values)
+            cls._dict_plan = plan
+
+        return plan
 
     def to_rpc_dict(self) -> Dict[str, Any]:
-        """To a dict compatible with web3.py or JSON-RPC
+        """To a dict compatible with web3.py or JSON-RPC.  Access list storage
+        keys are given as 0x-prefixed 32-byte hex strings.
 
         :return: Transaction dict
         """
-        d: Dict[str, Any] = {}
+        # Subclasses are given a version specialized to their fields when
+        # they're defined.  This only runs for overrides calling super().
+        return self._rpc_dict_func()(self)
 
-        for name, _ in self.__class__._meta.fields:
-            key = (
-                RPC_TX_PROP_TRANSLATION[name]
-                if name in RPC_TX_PROP_TRANSLATION
-                else name
-            )
+    @classmethod
+    def _rpc_dict_func(cls) -> Callable[[Any], Dict[str, Any]]:
+        """Return the to_rpc_dict generated for this class's fields.  Computed
+        once per class."""
+        # Look in the class's own namespace so subclasses get their own
+        func = cls.__dict__.get("_rpc_dict_generated")
+
+        if func is None:
+            func = _compile_to_rpc_dict(cls)
+            cls._rpc_dict_generated = func
+
+        return func
 
-            if key in RPC_TX_PROPS:
-                # Need to format an access list differently for web3/RPC-like
-                # objects.  It expects a list of objects
-                if key == "accessList":
-                    orig = getattr(self, name)
-                    d[key] = []
-                    for item in orig:
-                        d[key].append(
-                            {
-                                "address": item[0],
-                                "storageKeys": [
-                                    int.from_bytes(slot, "big") for slot in item[1]
-                                ],
-                            }
-                        )
-                else:
-                    d[key] = getattr(self, name)
-
-        return d
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Fields are fixed per class, so generate a straight-line to_rpc_dict
+        # unless the class defines or inherits a custom one
+        current = cls.to_rpc_dict
+
+        if (
+            getattr(current, "_generated", False)
+            or current is SerializableTransaction.to_rpc_dict
+        ):
+            cls.to_rpc_dict = cls._rpc_dict_func()
 
 
 class Transaction(SerializableTransaction):
@@ -262,21 +413,13 @@ class Transaction(SerializableTransaction):
     .. _`EIP-155`: https://eips.ethereum.org/EIPS/eip-155
     """
 
-    fields = [
-        ("nonce", big_endian_int),
-        ("gas_price", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
-        ("chain_id", big_endian_int),
-        # Expected nine elements as part of EIP-155 transactions
-        ("dummy1", big_endian_int),
-        ("dummy2", big_endian_int),
-    ]
+    fields = LEGACY_TX_FIELDS + [("chain_id", big_endian_int)]
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.LEGACY
+    _TYPE_INT = TransactionType.LEGACY.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = (int, int, int, bytes, int, bytes, int)
 
     def __init__(
         self,
@@ -287,8 +430,6 @@ class Transaction(SerializableTransaction):
         amount: int,
         data: bytes,
         chain_id: int = DEFAULT_CHAIN_ID,
-        dummy1: int = 0,
-        dummy2: int = 0,
     ):
         """Initialize an unsigned transaction
 
@@ -299,8 +440,6 @@ class Transaction(SerializableTransaction):
         :param amount: (``int``) Amount of Ether to send in wei
         :param data: (``bytes``) Transaction data
         :param chain_id: (``int``) Chain ID
-        :param dummy1: (``int``) **DO NOT SET**
-        :param dummy2: (``int``) **DO NOT SET**
         """
 
         if chain_id > MAX_LEGACY_CHAIN_ID:
@@ -322,10 +461,36 @@ class Transaction(SerializableTransaction):
             amount,
             data,
             chain_id,
-            dummy1,
-            dummy2,
         )
 
+    @classmethod
+    def serialize(cls, obj):
+        """Serialize with the two empty trailing values the EIP-155 signing
+        pre-image expects after chain_id."""
+        return (*super().serialize(obj), *EIP155_TRAILER)
+
+    @classmethod
+    def deserialize(cls, serial, **extra_kwargs):
+        """Deserialize, dropping the EIP-155 trailer if present"""
+        return super().deserialize(cls._strip_eip155_trailer(serial), **extra_kwargs)
+
+    @classmethod
+    def _strip_eip155_trailer(cls, serial):
+        """Drop the EIP-155 trailer following chain_id if present.  Anything
+        other than the empty trailer (e.g. a signed tx's v, r, s) is rejected
+        rather than dropped."""
+        field_count = len(cls._meta.fields)
+
+        if len(serial) != field_count + len(EIP155_TRAILER):
+            return serial
+
+        if tuple(serial[field_count:]) != EIP155_TRAILER:
+            raise DeserializationError(
+                "Expected an empty EIP-155 trailer after chain_id", serial
+            )
+
+        return serial[:field_count]
+
     @classmethod
     def from_rawtx(cls, rawtx: bytes) -> Transaction:
         """Instantiate a Transaction object from a raw encoded transaction
@@ -338,7 +503,7 @@ class Transaction(SerializableTransaction):
 
         return Transaction(
             *coerce_list_types(
-                [int, int, int, bytes, int, bytes, int, int, int], decode(rawtx)
+                cls._COERCE_TYPES, cls._strip_eip155_trailer(decode(rawtx))
             )
         )
 
@@ -356,19 +521,13 @@ class Type1Transaction(SerializableTransaction):
         0x01 || rlp([chainId, nonce, gasPrice, gasLimit, destination, amount, data, accessList])
     """
 
-    fields = [
-        ("chain_id", big_endian_int),
-        ("nonce", big_endian_int),
-        ("gas_price", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
-        ("access_list", access_list_sede_type),
-    ]
+    fields = TYPE1_TX_FIELDS
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.EIP_2930
+    _TYPE_INT = TransactionType.EIP_2930.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = (int, int, int, int, bytes, int, bytes, None)
 
     def __init__(
         self,
@@ -424,16 +583,13 @@ class Type1Transaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw transaction to instantiate with
         :returns: :class:`ledgereth.objects.Type1Transaction`
         """
-        if rawtx[0] != cls.transaction_type:
+        if rawtx[0] != cls._TYPE_INT:
             raise ValueError(
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
         return Type1Transaction(
-            *coerce_list_types(
-                [int, int, int, int, bytes, int, bytes, None],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._COERCE_TYPES, decode(rawtx[1:]))
         )
 
 
@@ -450,20 +606,13 @@ class Type2Transaction(SerializableTransaction):
         0x02 || rlp([chain_id, nonce, max_priority_fee_per_gas, max_fee_per_gas, gas_limit, destination, amount, data, access_list])
     """
 
-    fields = [
-        ("chain_id", big_endian_int),
-        ("nonce", big_endian_int),
-        ("max_priority_fee_per_gas", big_endian_int),
-        ("max_fee_per_gas", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
-        ("access_list", access_list_sede_type),
-    ]
+    fields = TYPE2_TX_FIELDS
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.EIP_1559
+    _TYPE_INT = TransactionType.EIP_1559.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = (int, int, int, int, int, bytes, int, bytes, None)
 
     def __init__(
         self,
@@ -524,29 +673,20 @@ class Type2Transaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw transaction to instantiate with
         :returns: :class:`ledgereth.objects.Type2Transaction`
         """
-        if rawtx[0] != cls.transaction_type:
+        if rawtx[0] != cls._TYPE_INT:
             raise ValueError(
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
         return Type2Transaction(
-            *coerce_list_types(
-                [int, int, int, int, int, bytes, int, bytes, None],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._COERCE_TYPES, decode(rawtx[1:]))
         )
 
 
 class SignedTransaction(SerializableTransaction):
     """Signed legacy or EIP-155 transaction"""
 
-    fields = [
-        ("nonce", big_endian_int),
-        ("gas_price", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
+    fields = LEGACY_TX_FIELDS + [
         ("v", big_endian_int),
         ("r", big_endian_int),
         ("s", big_endian_int),
@@ -554,6 +694,9 @@ class SignedTransaction(SerializableTransaction):
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.LEGACY
+    _TYPE_INT = TransactionType.LEGACY.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = (int, int, int, bytes, int, bytes, int, int, int)
 
     def __init__(
         self,
@@ -593,9 +736,7 @@ class SignedTransaction(SerializableTransaction):
         if rawtx[0] < 127:
             raise ValueError("Transaction is not a legacy transaction")
 
-        return SignedTransaction(
-            *coerce_list_types([int, int, int, int, bytes, int, bytes], decode(rawtx))
-        )
+        return SignedTransaction(*coerce_list_types(cls._COERCE_TYPES, decode(rawtx)))
 
     def raw_transaction(self):
         """Return an encoded raw signed transaction
@@ -608,7 +749,7 @@ class SignedTransaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """
-        return encode_hex(encode(self, SignedTransaction))
+        return "0x" + encode(self, SignedTransaction).hex()
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
@@ -618,22 +759,13 @@ class SignedTransaction(SerializableTransaction):
 class SignedType1Transaction(SerializableTransaction):
     """A signed Type 1 transaction."""
 
-    fields = [
-        ("chain_id", big_endian_int),
-        ("nonce", big_endian_int),
-        ("gas_price", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
-        ("access_list", access_list_sede_type),
-        ("y_parity", big_endian_int),
-        ("sender_r", big_endian_int),
-        ("sender_s", big_endian_int),
-    ]
+    fields = TYPE1_TX_FIELDS + TYPED_TX_SIGNATURE_FIELDS
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.EIP_2930
+    _TYPE_INT = TransactionType.EIP_2930.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = Type1Transaction._COERCE_TYPES + (int, int, int)
 
     def __init__(
         self,
@@ -686,16 +818,13 @@ class SignedType1Transaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw signed transaction to instantiate with
         :returns: :class:`ledgereth.objects.SignedType1Transaction`
         """
-        if rawtx[0] != cls.transaction_type:
+        if rawtx[0] != cls._TYPE_INT:
             raise ValueError(
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
         return SignedType1Transaction(
-            *coerce_list_types(
-                [int, int, int, int, bytes, int, bytes, None, int, int, int],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._COERCE_TYPES, decode(rawtx[1:]))
         )
 
     def raw_transaction(self):
@@ -709,7 +838,11 @@ class SignedType1Transaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """
-        return encode_hex(b"\x01" + encode(self, SignedType1Transaction))
+        return (
+            "0x"
+            + self.transaction_type.to_byte().hex()
+            + encode(self, SignedType1Transaction).hex()
+        )
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
@@ -719,23 +852,13 @@ class SignedType1Transaction(SerializableTransaction):
 class SignedType2Transaction(SerializableTransaction):
     """A signed Type 2 transaction."""
 
-    fields = [
-        ("chain_id", big_endian_int),
-        ("nonce", big_endian_int),
-        ("max_priority_fee_per_gas", big_endian_int),
-        ("max_fee_per_gas", big_endian_int),
-        ("gas_limit", big_endian_int),
-        ("destination", address_allow_empty),
-        ("amount", big_endian_int),
-        ("data", binary),
-        ("access_list", access_list_sede_type),
-        ("y_parity", big_endian_int),
-        ("sender_r", big_endian_int),
-        ("sender_s", big_endian_int),
-    ]
+    fields = TYPE2_TX_FIELDS + TYPED_TX_SIGNATURE_FIELDS
 
     #: The EIP-2718 transaction type
     transaction_type = TransactionType.EIP_1559
+    _TYPE_INT = TransactionType.EIP_1559.value
+    #: Types to coerce decoded RLP list items to, in field order
+    _COERCE_TYPES = Type2Transaction._COERCE_TYPES + (int, int, int)
 
     def __init__(
         self,
@@ -793,29 +916,13 @@ class SignedType2Transaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw signed transaction to instantiate with
         :returns: :class:`ledgereth.objects.SignedType2Transaction`
         """
-        if rawtx[0] != cls.transaction_type:
+        if rawtx[0] != cls._TYPE_INT:
             raise ValueError(
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
         return SignedType2Transaction(
-            *coerce_list_types(
-                [
-                    int,
-                    int,
-                    int,
-                    int,
-                    int,
-                    bytes,
-                    int,
-                    bytes,
-                    None,
-                    int,
-                    int,
-                    int,
-                ],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._COERCE_TYPES, decode(rawtx[1:]))
         )
 
     def raw_transaction(self):
@@ -829,7 +936,11 @@ class SignedType2Transaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """
-        return encode_hex(b"\x02" + encode(self, SignedType2Transaction))
+        return (
+            "0x"
+            + self.transaction_type.to_byte().hex()
+            + encode(self, SignedType2Transaction).hex()
+        )
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
@@ -844,6 +955,8 @@ class Signed(ABC):
     #: Signature s
     s: int
 
+    __slots__ = ("v", "r", "s")
+
     def __init__(self, v, r, s):
         self.v = v
         self.r = r
@@ -855,14 +968,15 @@ class Signed(ABC):
 
         :returns: Signature ``bytes``
         """
-        if not self.v or not self.r or not self.s:
+        if self.v is None or self.r is None or self.s is None:
             raise ValueError("Missing v, r, or s")
 
-        return encode_hex(
-            self.r.to_bytes(32, "big")
-            + self.s.to_bytes(32, "big")
-            + self.v.to_bytes(1, "big")
-        )
+        buf = bytearray(65)
+        buf[0:32] = self.r.to_bytes(32, "big")
+        buf[32:64] = self.s.to_bytes(32, "big")
+        buf[64] = self.v
+
+        return "0x" + buf.hex()
 
 
 class SignedMessage(Signed):
@@ -870,6 +984,8 @@ class SignedMessage(Signed):
 
     message: bytes
 
+    __slots__ = ("message",)
+
     def __init__(self, message, v, r, s):
         """Initialize a singed message
 
@@ -888,6 +1004,8 @@ class SignedTypedMessage(Signed):
     domain_hash: bytes
     message_hash: bytes
 
+    __slots__ = ("domain_hash", "message_hash")
+
     def __init__(self, domain_hash, message_hash, v, r, s):
         """Initialize a singed message
 
@@ -4,8 +4,8 @@ from typing import List, Optional, Tuple, Union
 from eth_utils import decode_hex
 from rlp import Serializable, encode
 
-from ledgereth.comms import Dongle, dongle_send_data, init_dongle
-from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_CHAIN_ID, DEFAULT_PATH_STRING
+from ledgereth.comms import Dongle, dongle_send_data_stream, init_dongle
+from ledgereth.constants import DEFAULT_CHAIN_ID, DEFAULT_PATH_STRING
 from ledgereth.objects import (
     SerializableTransaction,
     SignedTransaction,
@@ -17,9 +17,7 @@ from ledgereth.objects import (
     Type2Transaction,
 )
 from ledgereth.utils import (
-    chunks,
     coerce_access_list,
-    is_bip32_path,
     is_hex_string,
     parse_bip32_path,
 )
@@ -46,44 +44,37 @@ def sign_transaction(
     """
     given_dongle = dongle is not None
     dongle = init_dongle(dongle)
-    retval = None
 
+    # Typed transactions are prefixed with their type byte.  It's joined into
+    # the payload below to avoid copying the encoded tx an extra time.
     if isinstance(tx, Transaction):
+        tx_prefix = b""
         encoded_tx = encode(tx, Transaction)
     elif isinstance(tx, Type1Transaction):
-        encoded_tx = tx.transaction_type.to_byte() + encode(tx, Type1Transaction)
+        tx_prefix = tx.transaction_type.to_byte()
+        encoded_tx = encode(tx, Type1Transaction)
     elif isinstance(tx, Type2Transaction):
-        encoded_tx = tx.transaction_type.to_byte() + encode(tx, Type2Transaction)
+        tx_prefix = tx.transaction_type.to_byte()
+        encoded_tx = encode(tx, Type2Transaction)
     else:
         raise ValueError(
             "Only Transaction and Type2Transaction objects are currently supported"
         )
 
-    if not is_bip32_path(sender_path):
-        raise ValueError("Invalid sender BIP32 path given to sign_transaction")
-
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + encoded_tx
+    try:
+        path = parse_bip32_path(sender_path)
+    except ValueError:
+        raise ValueError(
+            "Invalid sender BIP32 path given to sign_transaction"
+        ) from None
 
-    chunk_count = 0
-    for chunk in chunks(payload, DATA_CHUNK_SIZE):
-        chunk_size = len(chunk)
+    payload = b"".join(
+        ((len(path) // 4).to_bytes(1, "big"), path, tx_prefix, encoded_tx)
+    )
 
-        if chunk_count == 0:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_TX_FIRST_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        else:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_TX_SECONDARY_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        chunk_count += 1
+    retval = dongle_send_data_stream(
+        dongle, "SIGN_TX_FIRST_DATA", "SIGN_TX_SECONDARY_DATA", payload
+    )
 
     if retval is None or len(retval) < 64:
         raise Exception("Invalid response from Ledger")
@@ -8,6 +8,7 @@ from typing import (
     Generator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -20,8 +21,11 @@ from ledgereth.constants import DEFAULTS
 # 44'/60'/0'/0/x
 BIP32_ETH_PATTERN = r"^44'/60'/[0-9]+'/[0-9]+/[0-9]+$"
 BIP32_LEGACY_LEDGER_PATTERN = r"^44'/60'/[0-9]+'/[0-9]+$"
+BIP32_PATH_RE = re.compile(f"{BIP32_ETH_PATTERN}|{BIP32_LEGACY_LEDGER_PATTERN}")
+BIP32_HARDENED = 0x80000000
 
 COERCERS: Dict[Type, Callable] = {int: lambda v: int.from_bytes(v, "big")}
+COERCION_PLANS: Dict[Tuple[Optional[type], ...], Tuple[Optional[Callable], ...]] = {}
 
 
 def is_bytes(v: Any) -> bool:
@@ -38,10 +42,11 @@ def is_hex_string(v: Any) -> bool:
 
 def is_bip32_path(path: str) -> bool:
     """Detect if a string a bip32 path that can be given to a Ledger device"""
-    return (
-        re.match(BIP32_ETH_PATTERN, path) is not None
-        or re.match(BIP32_LEGACY_LEDGER_PATTERN, path) is not None
-    )
+    try:
+        parse_bip32_path(path)
+    except ValueError:
+        return False
+    return True
 
 
 def chunks(it: bytes, chunk_size: int) -> Generator[bytes, None, None]:
@@ -63,24 +68,27 @@ def chunks(it: bytes, chunk_size: int) -> Generator[bytes, None, None]:
 
 
 def parse_bip32_path(path: str) -> bytes:
-    if not path:
-        return b""
+    """Validate and encode a BIP-32 path string for the Ledger device
 
-    result = b""
-    elements = path.split("/")
+    :raises ValueError: If the path is not a valid Ethereum BIP-32 path
+    """
+    if not isinstance(path, str) or BIP32_PATH_RE.fullmatch(path) is None:
+        raise ValueError("Invalid BIP32 Ethereum path")
 
-    for pathElement in elements:
-        element = pathElement.split("'")
+    indexes = []
 
-        # Wihout tick (') == 1
-        if len(element) == 1:
-            # "public" BIP-44 derivation
-            result = result + struct.pack(">I", int(element[0]))
-        else:
-            # "private" BIP-44 derivation
-            result = result + struct.pack(">I", 0x80000000 | int(element[0]))
+    for element in path.split("/"):
+        # "private" BIP-44 derivation if it has a tick (')
+        hardened = element.endswith("'")
+        index = int(element[:-1] if hardened else element)
 
-    return result
+        # Anything larger would collide with the hardened bit
+        if index >= BIP32_HARDENED:
+            raise ValueError("Invalid BIP32 Ethereum path")
+
+        indexes.append(index | BIP32_HARDENED if hardened else index)
+
+    return struct.pack(f">{len(indexes)}I", *indexes)
 
 
 def decode_bip32_path(path: bytes) -> str:
@@ -191,27 +199,54 @@ def coerce_access_list(access_list):
     return access_list
 
 
+def _coercer_for(this_type: Optional[type]) -> Optional[Callable]:
+    """Get a single-value coercer for a type, or None to leave values as-is"""
+    if this_type is None:
+        return None
+
+    # The common RLP types get a single call without the generic lookup.
+    # Falsy values (e.g. None) still become the DEFAULTS value.
+    if this_type is int:
+        default_int = DEFAULTS[int]
+        return lambda v: int.from_bytes(v, "big") if v else default_int
+
+    if this_type is bytes:
+        default_bytes = DEFAULTS[bytes]
+        return lambda v: bytes(v) if v else default_bytes
+
+    convert = COERCERS.get(this_type, this_type)
+
+    def coerce(v):
+        # Some things don't transalate, like b'' being 0
+        return convert(v) if v else DEFAULTS[this_type]
+
+    return coerce
+
+
+def _coercion_plan(types: Sequence[Optional[type]]) -> Tuple[Optional[Callable], ...]:
+    """Get the per-position coercers for a types sequence.  Plans are built
+    once per distinct types tuple."""
+    key = tuple(types)
+    plan = COERCION_PLANS.get(key)
+
+    if plan is None:
+        plan = tuple(_coercer_for(t) for t in key)
+        COERCION_PLANS[key] = plan
+
+    return plan
+
+
 def coerce_list_types(
-    types: List[Optional[type]], to_coerce: List[Union[Any, None]]
+    types: Sequence[Optional[type]], to_coerce: List[Union[Any, None]]
 ) -> List[Any]:
     """Coerce types of a list to given types in order"""
+    plan = _coercion_plan(types)
 
     for i, v in enumerate(to_coerce):
-        # SKIP!
-        if types[i] is None:
-            continue
-
-        # Only way to get mypy to chill was to assign to its own var
-        this_type = types[i]
-        assert this_type is not None
+        coerce = plan[i]
 
-        # Some things don't transalate, like b'' being 0
-        if not v:
-            to_coerce[i] = DEFAULTS[this_type]
-        else:
-            if types[i] in COERCERS:
-                to_coerce[i] = COERCERS[this_type](v)
-            else:
-                to_coerce[i] = this_type(v)
+        # SKIP!
+        if coerce is not None:
+            to_coerce[i] = coerce(v)
 
     return to_coerce
@@ -1,12 +1,18 @@
-# Some of the following imports utilize web3.py deps that are not deps of
-# ledgereth.
-from eth_account.messages import encode_structured_data
-from eth_utils import decode_hex, encode_hex
-from rlp import encode
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_utils import decode_hex, to_checksum_address
 
 from ledgereth.accounts import find_account, get_accounts
+from ledgereth.comms import Dongle, LedgerSession
 from ledgereth.messages import sign_message, sign_typed_data_draft
-from ledgereth.objects import SignedTransaction
+from ledgereth.objects import LedgerAccount
 from ledgereth.transactions import create_transaction
 from ledgereth.utils import decode_web3_access_list
 
@@ -39,6 +45,115 @@ https://github.com/ethereum/EIPs/issues/84#issuecomment-292324521
 """
 
 
+def _hex_to_int(v):
+    """Convert a JSON-RPC quantity to an int.  web3.py usually gives hex
+    strings but may pass ints through as-is."""
+    if v is None:
+        return None
+    return int(v, 16) if isinstance(v, str) else int(v)
+
+
+def _fee_args(tx_obj) -> Dict[str, Optional[int]]:
+    """Convert the fee fields of a transaction to create_transaction()
+    arguments.  Only the fields used by its shape (EIP-1559 or gas price) are
+    converted.  Anything else passes every fee through so create_transaction()
+    can reject the combination."""
+    get = tx_obj.get
+    gas_price = get("gasPrice")
+    max_fee_per_gas = get("maxFeePerGas")
+
+    if max_fee_per_gas and not gas_price:
+        return {
+            "max_fee_per_gas": _hex_to_int(max_fee_per_gas),
+            "max_priority_fee_per_gas": _hex_to_int(get("maxPriorityFeePerGas")),
+        }
+
+    if gas_price and not max_fee_per_gas and not get("maxPriorityFeePerGas"):
+        return {"gas_price": _hex_to_int(gas_price)}
+
+    return {
+        "gas_price": _hex_to_int(gas_price),
+        "max_fee_per_gas": _hex_to_int(max_fee_per_gas),
+        "max_priority_fee_per_gas": _hex_to_int(get("maxPriorityFeePerGas")),
+    }
+
+
+#: JSON-RPC methods handled by the middleware rather than passed on
+INTERCEPTED_METHODS = frozenset(
+    ("eth_sendTransaction", "eth_accounts", "eth_sign", "eth_signTypedData")
+)
+
+#: Fields eth_sendTransaction must provide, paired with how errors name them.
+#: Any one of an entry's alternative fields satisfies it.
+REQUIRED_TX_FIELDS = tuple(
+    (fields, " or ".join(f'"{field}"' for field in fields))
+    for fields in (("from",), ("gas",), ("gasPrice", "maxFeePerGas"))
+)
+
+#: Upper bound on concurrent node requests made for one batch
+NONCE_LOOKUP_WORKERS = 8
+
+#: How many typed data hashes to remember for re-signing the same message
+TYPED_DATA_CACHE_SIZE = 128
+_typed_data_cache: "OrderedDict[bytes, Tuple[bytes, bytes]]" = OrderedDict()
+_typed_data_lock = threading.Lock()
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Check a value only holds types that survive a JSON round-trip
+    unchanged, so its serialization can't match a different value's"""
+    value_type = type(value)
+
+    if value_type is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+
+    if value_type is list:
+        return all(_is_plain_json(v) for v in value)
+
+    return value is None or value_type in (str, int, float, bool)
+
+
+def _hash_typed_data(typed_data: dict) -> Tuple[bytes, bytes]:
+    """Get the EIP-712 domain and message hashes for typed data.  Recently
+    hashed messages are remembered so re-signing them skips the encoding.
+
+    :return: Domain hash and message hash
+    """
+    if _is_plain_json(typed_data):
+        key: Optional[bytes] = hashlib.blake2b(
+            json.dumps(typed_data, sort_keys=True, separators=(",", ":")).encode()
+        ).digest()
+    else:
+        # JSON would make it look the same as some other payload (e.g. int
+        # keys become strings), so there's no reliable key for it
+        key = None
+
+    if key is not None:
+        with _typed_data_lock:
+            hashes = _typed_data_cache.get(key)
+
+            if hashes is not None:
+                _typed_data_cache.move_to_end(key)
+                return hashes
+
+    # eth_account is a web3.py dependency, not a ledgereth one, and is slow to
+    # import, so only load it once typed data is actually being signed
+    from eth_account.messages import encode_structured_data
+
+    # Use eth_account to encode and hash the typed data
+    signable = encode_structured_data(typed_data)
+    hashes = (signable.header, signable.body)
+
+    if key is not None:
+        with _typed_data_lock:
+            _typed_data_cache[key] = hashes
+
+            if len(_typed_data_cache) > TYPED_DATA_CACHE_SIZE:
+                _typed_data_cache.popitem(last=False)
+
+    return hashes
+
+
 class LedgerSignerMiddleware:
     """Web3.py middleware.  It will automatically intercept the relevant
     JSON-RPC calls and respond with data from your Ledger device.
@@ -64,92 +179,257 @@ class LedgerSignerMiddleware:
 
     _dongle = None
 
+    #: JSON-RPC method to the name of its handler method
+    _HANDLERS = {method: f"_handle_{method}" for method in INTERCEPTED_METHODS}
+
     def __init__(self, make_request, w3):
         self.w3 = w3
         self.make_request = make_request
+        # Bind the handlers once so each call is a single dict lookup
+        self._dispatch = {
+            method: getattr(self, name) for method, name in self._HANDLERS.items()
+        }
+        # Ledger accounts already derived, keyed by checksum and lowercase
+        # address
+        self._account_cache: Dict[str, LedgerAccount] = {}
+        self._accounts_list: Optional[List[LedgerAccount]] = None
+        # Connection to the device opened by the middleware itself
+        self._session: Optional[LedgerSession] = None
+        self._dongle_lock = threading.Lock()
+        # Fixed for the life of a provider, so only fetched once
+        self._chain_id: Optional[int] = None
 
     def __call__(self, method, params):
-        if method == "eth_sendTransaction":
-            return self._handle_eth_sendTransaction(method, params)
+        handler = self._dispatch.get(method)
+
+        if handler is None:
+            # Send on to the next middleware(s)
+            return self.make_request(method, params)
+
+        return handler(method, params)
+
+    def _get_dongle(self) -> Dongle:
+        """Return the dongle to use, connecting to the device once on first use
+        and reusing that connection for every request after"""
+        # A dongle given to the middleware is used as-is
+        if self._dongle is not None:
+            return self._dongle
+
+        # Once the session is connected and verified, skip the lock
+        session = self._session
 
-        elif method == "eth_accounts":
-            return self._handle_eth_accounts(method, params)
+        if session is not None and session.config is not None and session.dongle:
+            return session.dongle
 
-        elif method == "eth_sign":
-            return self._handle_eth_sign(method, params)
+        # web3.py may call into the middleware from multiple threads
+        with self._dongle_lock:
+            if self._session is None:
+                self._session = LedgerSession()
 
-        elif method == "eth_signTypedData":
-            return self._handle_eth_signTypedData(method, params)
+            return self._session.ensure()
 
-        # Send on to the next middleware(s)
-        return self.make_request(method, params)
+    def close(self):
+        """Close the connection to the Ledger device if the middleware opened
+        it.  A new one is opened if the middleware is used again."""
+        with self._dongle_lock:
+            if self._session is not None and self._session.dongle is not None:
+                self._session.dongle.close()
+            self._session = None
+
+    def clear_chain_id_cache(self):
+        """Forget the chain ID so it's fetched from the node again on next use"""
+        self._chain_id = None
+
+    def clear_account_cache(self):
+        """Forget accounts derived from the Ledger device so they're fetched
+        again on next use"""
+        self._account_cache.clear()
+        self._accounts_list = None
+
+    def _cache_account(self, account: LedgerAccount):
+        self._account_cache[account.address] = account
+        self._account_cache[account.address.lower()] = account
+
+    def _find_account(self, address: str) -> Optional[LedgerAccount]:
+        """Find a Ledger account by address, only going to the device for
+        accounts that haven't been seen yet"""
+        account = self._account_cache.get(address)
+
+        if account is None:
+            address = to_checksum_address(address)
+            account = self._account_cache.get(address)
+
+        if account is None:
+            account = find_account(address, dongle=self._get_dongle())
+
+            if account is not None:
+                self._cache_account(account)
+
+        return account
 
     def _handle_eth_accounts(self, method, params):
         """Handler for eth_accounts RPC calls"""
+        if self._accounts_list is None:
+            self._accounts_list = get_accounts(dongle=self._get_dongle())
+
+            for account in self._accounts_list:
+                self._cache_account(account)
+
         return {
-            "result": list(map(lambda a: a.address, get_accounts(dongle=self._dongle))),
+            "result": [a.address for a in self._accounts_list],
         }
 
     def _handle_eth_sendTransaction(self, method, params):
         """Handler for eth_sendTransaction RPC calls"""
-        new_params = []
+        if self._chain_id is None:
+            self._chain_id = int(self.w3.eth.chain_id)
+        chain_id = self._chain_id
+
+        # web3.py always sends a single transaction
+        if len(params) == 1:
+            new_params = [self._sign_one(params[0], chain_id)]
+        else:
+            # Check the whole batch before anything is signed on the device
+            senders = [self._validate_tx(tx_obj) for tx_obj in params]
+            accounts = self._sender_accounts(senders)
+            nonces = self._fetch_nonces(self._nonce_senders(params, accounts))
+
+            new_params = [
+                self._sign_tx(
+                    tx_obj, account, chain_id, self._take_nonce(tx_obj, account, nonces)
+                )
+                for tx_obj, account in zip(params, accounts)
+            ]
+
+        # Change to raw tx call
+        return self.make_request("eth_sendRawTransaction", new_params)
+
+    def _sign_one(self, tx_obj, chain_id):
+        """Validate and sign a lone transaction from an eth_sendTransaction
+        call
+
+        :return: Raw signed transaction
+        """
+        sender_address = self._validate_tx(tx_obj)
+        sender_account = self._find_account(sender_address)
+
+        if not sender_account:
+            raise Exception(f"Account {sender_address} not found")
 
-        for tx_obj in params:
-            sender_address = tx_obj.get("from")
-            nonce = tx_obj.get("nonce")
-            gas = tx_obj.get("gas")
-            gas_price = tx_obj.get("gasPrice")
-            max_fee_per_gas = tx_obj.get("maxFeePerGas")
-            max_priority_fee_per_gas = tx_obj.get("maxPriorityFeePerGas")
-            value = tx_obj.get("value", "0x00")
-            access_list = None
+        nonce = _hex_to_int(tx_obj.get("nonce"))
 
-            if not sender_address:
-                # TODO: Should this use a default?
-                raise ValueError('"from" field not provided')
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(sender_account.address)
 
-            if not gas:
-                # TODO: What's the default web3.py behavior for this?
-                raise ValueError('"gas" field not provided')
+        return self._sign_tx(tx_obj, sender_account, chain_id, nonce)
 
-            if not gas_price and not max_fee_per_gas:
-                raise ValueError('"gasPrice" or "maxFeePerGas" field not provided')
+    def _sender_accounts(self, senders: List[str]) -> List[LedgerAccount]:
+        """Find the Ledger account for each sender address
 
-            sender_account = find_account(sender_address, dongle=self._dongle)
+        :return: Accounts in the same order as senders
+        """
+        accounts = []
+
+        for sender_address in senders:
+            sender_account = self._find_account(sender_address)
 
             if not sender_account:
                 raise Exception(f"Account {sender_address} not found")
 
-            if nonce is None:
-                nonce = self.w3.eth.get_transaction_count(sender_address)
-
-            if "accessList" in tx_obj:
-                access_list = decode_web3_access_list(tx_obj["accessList"])
-
-            signed_tx = create_transaction(
-                chain_id=self.w3.eth.chain_id,
-                destination=tx_obj.get("to"),
-                amount=int(value, 16),
-                gas=int(gas, 16),
-                gas_price=int(gas_price, 16) if gas_price else None,
-                max_fee_per_gas=int(max_fee_per_gas, 16) if max_fee_per_gas else None,
-                max_priority_fee_per_gas=int(max_priority_fee_per_gas, 16)
-                if max_priority_fee_per_gas
-                else None,
-                nonce=nonce,
-                data=tx_obj.get("data", b""),
-                sender_path=sender_account.path,
-                access_list=access_list,
-                dongle=self._dongle,
-            )
+            accounts.append(sender_account)
 
-            new_params.append(signed_tx.rawTransaction)
+        return accounts
 
-        # Change to raw tx call
-        method = "eth_sendRawTransaction"
-        params = new_params
+    @staticmethod
+    def _nonce_senders(params, accounts: List[LedgerAccount]) -> List[str]:
+        """Get the distinct sender addresses in a batch that need their nonce
+        looked up"""
+        return list(
+            dict.fromkeys(
+                account.address
+                for tx_obj, account in zip(params, accounts)
+                if tx_obj.get("nonce") is None
+            )
+        )
+
+    @staticmethod
+    def _take_nonce(tx_obj, account: LedgerAccount, nonces: Dict[str, int]) -> int:
+        """Get the nonce to sign a transaction with.  Nonces are tracked per
+        sender so a batch from one sender increments them.
+
+        :param nonces: Next nonce for each sender without an explicit one
+        """
+        nonce = _hex_to_int(tx_obj.get("nonce"))
+
+        if nonce is None:
+            nonce = nonces[account.address]
+            nonces[account.address] = nonce + 1
+
+        return nonce
+
+    def _fetch_nonces(self, addresses: List[str]) -> Dict[str, int]:
+        """Look up the next nonce of each address
+
+        These are node round-trips rather than device calls, so they're made
+        concurrently when there's more than one sender.  Signing still happens
+        one transaction at a time.
+        """
+        get_transaction_count = self.w3.eth.get_transaction_count
+
+        if len(addresses) < 2:
+            return {address: get_transaction_count(address) for address in addresses}
+
+        workers = min(len(addresses), NONCE_LOOKUP_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = executor.map(get_transaction_count, addresses)
+            return dict(zip(addresses, counts))
+
+    def _validate_tx(self, tx_obj) -> str:
+        """Check a transaction has the fields needed to sign it
+
+        :return: Sender address
+        """
+        get = tx_obj.get
+        # TODO: Should "from" use a default?  What's the default web3.py
+        # behavior for "gas"?
+        missing = [
+            description
+            for fields, description in REQUIRED_TX_FIELDS
+            if not any(get(field) for field in fields)
+        ]
+
+        if missing:
+            plural = "s" if len(missing) > 1 else ""
+            raise ValueError(f"{', '.join(missing)} field{plural} not provided")
+
+        return tx_obj["from"]
+
+    def _sign_tx(self, tx_obj, sender_account, chain_id, nonce):
+        """Sign a transaction with the Ledger device
+
+        :return: Raw signed transaction
+        """
+        get = tx_obj.get
+        access_list = None
+
+        if "accessList" in tx_obj:
+            access_list = decode_web3_access_list(tx_obj["accessList"])
+
+        signed_tx = create_transaction(
+            chain_id=chain_id,
+            destination=get("to"),
+            amount=_hex_to_int(get("value", "0x00")),
+            gas=_hex_to_int(get("gas")),
+            nonce=nonce,
+            data=get("data", b""),
+            sender_path=sender_account.path,
+            access_list=access_list,
+            dongle=self._get_dongle(),
+            **_fee_args(tx_obj),
+        )
 
-        return self.make_request(method, params)
+        return signed_tx.rawTransaction
 
     def _handle_eth_sign(self, mehtod, params):
         """Handler for eth_sign RPC calls"""
@@ -157,10 +437,17 @@ class LedgerSignerMiddleware:
             raise ValueError("Unexpected RPC request params length for eth_sign")
 
         account = params[0]
-        message = decode_hex(params[1])
+        data = params[1]
+
+        # JSON-RPC gives a hex string, which bytes.fromhex() handles directly.
+        # Anything else gets the more lenient decode_hex().
+        try:
+            message = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+        except (AttributeError, TypeError, ValueError):
+            message = decode_hex(data)
 
-        signer_account = find_account(account, dongle=self._dongle)
-        signed = sign_message(message, signer_account.path, dongle=self._dongle)
+        signer_account = self._find_account(account)
+        signed = sign_message(message, signer_account.path, dongle=self._get_dongle())
 
         return {
             "result": signed.signature,
@@ -179,17 +466,114 @@ class LedgerSignerMiddleware:
                 "Expected type data to be a dictionary for second param for eth_signTypedData call"
             )
 
-        # Use eth_account to encode and hash the typed data
-        signable = encode_structured_data(typed_data)
-        domain_hash = signable.header
-        message_hash = signable.body
+        signer_account = self._account_cache.get(account)
+
+        if signer_account is None:
+            # Finding the account goes to the device, so hash the typed data
+            # while waiting on it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                hashes = executor.submit(_hash_typed_data, typed_data)
+                signer_account = self._find_account(account)
+                domain_hash, message_hash = hashes.result()
+        else:
+            domain_hash, message_hash = _hash_typed_data(typed_data)
 
-        # Find the account and sign with Ledger
-        signer_account = find_account(account, dongle=self._dongle)
+        # Sign with Ledger
         signed = sign_typed_data_draft(
-            domain_hash, message_hash, signer_account.path, dongle=self._dongle
+            domain_hash, message_hash, signer_account.path, dongle=self._get_dongle()
         )
 
         return {
             "result": signed.signature,
         }
+
+
+class AsyncLedgerSignerMiddleware(LedgerSignerMiddleware):
+    """Async Web3.py middleware for use with :code:`AsyncWeb3`.  It intercepts
+    the same JSON-RPC calls as :class:`LedgerSignerMiddleware`, awaiting calls
+    to the node and running Ledger device I/O in a worker thread so it doesn't
+    block the event loop.
+
+    :Example:
+
+    .. code:: python
+
+        >>> from web3 import AsyncHTTPProvider, AsyncWeb3
+        >>> from ledgereth.web3 import AsyncLedgerSignerMiddleware
+        >>> w3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+        >>> w3.middleware_onion.add(AsyncLedgerSignerMiddleware)
+        >>> await w3.eth.accounts
+        ['0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266', '0x8C8d35429F74ec245F8Ef2f4Fd1e551cFF97d650', '0x98e503f35D0a019cB0a251aD243a4cCFCF371F46']
+
+    """
+
+    def __init__(self, make_request, w3):
+        super().__init__(make_request, w3)
+        # The device can only handle one exchange at a time
+        self._device_lock = asyncio.Lock()
+
+    def __await__(self):
+        # web3.py awaits async middleware constructors
+        return self._constructed().__await__()
+
+    async def _constructed(self):
+        return self
+
+    async def __call__(self, method, params):
+        handler = self._dispatch.get(method)
+
+        if handler is None:
+            # Send on to the next middleware(s)
+            return await self.make_request(method, params)
+
+        return await handler(method, params)
+
+    async def _run_on_device(self, func, *args):
+        """Run a blocking call that talks to the Ledger device in a worker
+        thread"""
+        async with self._device_lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(func, *args))
+
+    async def _handle_eth_accounts(self, method, params):
+        """Handler for eth_accounts RPC calls"""
+        return await self._run_on_device(super()._handle_eth_accounts, method, params)
+
+    async def _handle_eth_sendTransaction(self, method, params):
+        """Handler for eth_sendTransaction RPC calls"""
+        if self._chain_id is None:
+            self._chain_id = int(await self.w3.eth.chain_id)
+        chain_id = self._chain_id
+
+        # Check the whole batch before anything is signed on the device
+        senders = [self._validate_tx(tx_obj) for tx_obj in params]
+        accounts = await self._run_on_device(self._sender_accounts, senders)
+
+        addresses = self._nonce_senders(params, accounts)
+        counts = await asyncio.gather(
+            *(self.w3.eth.get_transaction_count(address) for address in addresses)
+        )
+        nonces = dict(zip(addresses, counts))
+
+        new_params = []
+
+        for tx_obj, account in zip(params, accounts):
+            nonce = self._take_nonce(tx_obj, account, nonces)
+            new_params.append(
+                await self._run_on_device(
+                    self._sign_tx, tx_obj, account, chain_id, nonce
+                )
+            )
+
+        # Change to raw tx call
+        return await self.make_request("eth_sendRawTransaction", new_params)
+
+    async def _handle_eth_sign(self, method, params):
+        """Handler for eth_sign RPC calls"""
+        return await self._run_on_device(super()._handle_eth_sign, method, params)
+
+    async def _handle_eth_signTypedData(self, method, params):
+        """Handler for eth_signTypedData RPC calls"""
+        return await self._run_on_device(
+            super()._handle_eth_signTypedData, method, params
+        )
@@ -159,27 +159,25 @@ class MockDongle:
 
         return self._sign_typed(domain_hash, message_hash)
 
+    # APDU header (CLA + INS + P1 + P2) to handler method
+    handlers = {
+        b"\xe0\x06\x00\x00": handle_get_configuration,
+        b"\xe0\x02\x00\x00": handle_get_address,
+        b"\xe0\x04\x00\x00": handle_tx_first_data,
+        b"\xe0\x04\x80\x00": handle_tx_secondary_data,
+        b"\xe0\x08\x00\x00": handle_message_first_data,
+        b"\xe0\x08\x80\x00": handle_message_secondary_data,
+        b"\xe0\x0c\x00\x00": handle_sign_typed,
+    }
+
     def exchange(self, apdu, timeout=20000):
-        cmd = apdu[:4]
-        lc = apdu[4]
-        data = apdu[5:]
-
-        if cmd == b"\xe0\x06\x00\x00":
-            return self.handle_get_configuration(lc, data)
-        elif cmd == b"\xe0\x02\x00\x00":
-            return self.handle_get_address(lc, data)
-        elif cmd == b"\xe0\x04\x00\x00":
-            return self.handle_tx_first_data(lc, data)
-        elif cmd == b"\xe0\x04\x80\x00":
-            return self.handle_tx_secondary_data(lc, data)
-        elif cmd == b"\xe0\x08\x00\x00":
-            return self.handle_message_first_data(lc, data)
-        elif cmd == b"\xe0\x08\x80\x00":
-            return self.handle_message_secondary_data(lc, data)
-        elif cmd == b"\xe0\x0c\x00\x00":
-            return self.handle_sign_typed(lc, data)
-        else:
-            raise ValueError(f"Unknown command {decode_hex(cmd)}")
+        cmd = bytes(apdu[:4])
+        handler = self.handlers.get(cmd)
+
+        if handler is None:
+            raise ValueError(f"Unknown command {encode_hex(cmd)}")
+
+        return handler(self, apdu[4], apdu[5:])
 
 
 class MockExceptionDongle(MockDongle):
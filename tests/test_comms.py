@@ -7,6 +7,7 @@ TODO
     approve all the transactions when testing..  Might work with mock dongle if
     that ever gets done.
 """
+
 import binascii
 import os
 import re
@@ -15,12 +16,18 @@ import pytest
 import rlp
 from eth_utils import decode_hex, encode_hex
 
+from ledgereth.accounts import get_accounts
 from ledgereth.comms import (
+    LedgerCommands,
+    LedgerSession,
     decode_response_address,
     decode_response_version_from_config,
     dongle_send,
     dongle_send_data,
+    dongle_send_data_stream,
+    encode_apdu,
     init_dongle,
+    is_usable_version,
 )
 from ledgereth.constants import (
     DATA_CHUNK_SIZE,
@@ -53,6 +60,94 @@ def test_chunks(data_size):
     assert b"".join(parts) == data
 
 
+def test_comms_commands():
+    assert LedgerCommands.get(GET_CONFIGURATION) == b"\xe0\x06\x00\x00\x00"
+
+    with pytest.raises(ValueError):
+        LedgerCommands.get("NOT_A_COMMAND")
+
+    view = LedgerCommands.get_mv(GET_CONFIGURATION)
+    assert view.readonly
+    assert view == LedgerCommands.get(GET_CONFIGURATION)
+
+    with pytest.raises(ValueError):
+        LedgerCommands.get_mv("NOT_A_COMMAND")
+
+    with pytest.raises(ValueError):
+        LedgerCommands.get_with_data("NOT_A_COMMAND", b"\x00")
+
+
+def test_comms_commands_with_data():
+    data = b"\x01\x02\x03"
+
+    assert (
+        LedgerCommands.get_with_data(GET_ADDRESS_NO_CONFIRM, data, Le=b"\x00")
+        == b"\xe0\x02\x00\x00\x03" + data + b"\x00"
+    )
+    # Nothing should carry over from the previous call
+    assert (
+        LedgerCommands.get_with_data(GET_ADDRESS_NO_CONFIRM, data)
+        == b"\xe0\x02\x00\x00\x03" + data
+    )
+    assert LedgerCommands.get(GET_ADDRESS_NO_CONFIRM) == b"\xe0\x02\x00\x00\x00"
+
+
+def test_encode_apdu():
+    header = b"\xe0\x04\x00\x00"
+    data = b"\xde\xad\xbe\xef"
+
+    assert encode_apdu(header, data) == header + b"\x04" + data
+    assert encode_apdu(header, data, Lc=b"\x02") == header + b"\x02" + data
+    assert encode_apdu(header, data, Le=b"\x41") == header + b"\x04" + data + b"\x41"
+
+    # The scratch buffer is reused, so make sure nothing leaks between calls
+    large = os.urandom(DATA_CHUNK_SIZE)
+    assert encode_apdu(header, large) == header + b"\xff" + large
+    assert encode_apdu(header, data) == header + b"\x04" + data
+
+
+@pytest.mark.parametrize("size", [0, 4, DATA_CHUNK_SIZE, DATA_CHUNK_SIZE * 2 + 7])
+def test_dongle_send_data_stream_chunks(size):
+    """Test data streams are split into APDUs on chunk boundaries"""
+
+    class RecordingDongle:
+        def __init__(self):
+            self.sent = []
+
+        def exchange(self, apdu):
+            self.sent.append(apdu)
+            return bytes([len(self.sent)])
+
+    data = os.urandom(size)
+    dongle = RecordingDongle()
+
+    assert dongle_send_data_stream(
+        dongle, "SIGN_TX_FIRST_DATA", "SIGN_TX_SECONDARY_DATA", data
+    ) == bytes([len(dongle.sent)])
+    assert dongle.sent == [
+        LedgerCommands.get_with_data(
+            "SIGN_TX_SECONDARY_DATA" if i else "SIGN_TX_FIRST_DATA", chunk
+        )
+        for i, chunk in enumerate(chunks(data, DATA_CHUNK_SIZE))
+    ]
+
+
+@pytest.mark.parametrize(
+    "version,usable",
+    [
+        ((1, 2, 3), False),
+        ((1, 2, 4), True),
+        ((1, 3, 0), True),
+        ((1, 10, 0), True),
+        ((0, 9, 9), False),
+        ((2, 0, 0), False),
+        ((9, 9, 9), True),
+    ],
+)
+def test_is_usable_version(version, usable):
+    assert is_usable_version(bytes((0, *version))) is usable
+
+
 def test_comms_init_dongle_patched(monkeypatch, yield_dongle):
     with yield_dongle() as dongle:
 
@@ -66,6 +161,58 @@ def test_comms_init_dongle_patched(monkeypatch, yield_dongle):
         assert dong == dongle
 
 
+def test_comms_init_dongle_no_verify(monkeypatch, yield_dongle):
+    with yield_dongle() as dongle:
+        sent = []
+
+        def _exchange(apdu, timeout=20000):
+            sent.append(apdu)
+            return type(dongle).exchange(dongle, apdu, timeout)
+
+        dongle.exchange = _exchange
+        monkeypatch.setattr("ledgereth.comms.getDongle", lambda debug=False: dongle)
+        monkeypatch.setattr("ledgereth.comms.DEFAULT_SESSION", LedgerSession())
+
+        assert init_dongle(verify=False) == dongle
+        assert sent == []
+
+        assert init_dongle() == dongle
+        assert sent == [b"\xe0\x06\x00\x00\x00"]
+
+
+def test_comms_verify_once_per_session(monkeypatch, yield_dongle):
+    """Test the library entry points check the firmware version once"""
+    with yield_dongle() as dongle:
+        sent = []
+
+        def _exchange(apdu, timeout=20000):
+            sent.append(apdu)
+            return type(dongle).exchange(dongle, apdu, timeout)
+
+        dongle.exchange = _exchange
+        # Keep the session's dongle open between calls
+        dongle.close = lambda: None
+        monkeypatch.setattr("ledgereth.comms.getDongle", lambda debug=False: dongle)
+        monkeypatch.setattr("ledgereth.comms.DEFAULT_SESSION", LedgerSession())
+
+        get_accounts(count=1)
+        get_accounts(count=1)
+
+        assert sent.count(b"\xe0\x06\x00\x00\x00") == 1
+        assert sent[0] == b"\xe0\x06\x00\x00\x00"
+
+
+def test_comms_session(yield_dongle):
+    with yield_dongle() as dongle:
+        session = LedgerSession(dongle)
+
+        assert session.config is None
+        assert session.ensure(verify=False) == dongle
+        assert session.config is None
+        assert session.ensure() == dongle
+        assert session.config is not None
+
+
 def test_comms_init_dongle_mockdongle(yield_dongle):
     with yield_dongle() as dongle:
         dong = init_dongle(dongle)
@@ -218,6 +365,35 @@ def test_comms_sign_large_tx(yield_dongle):
         assert len(raw_tx) > 32  # TODO: Shrug
 
 
+def test_comms_sign_large_tx_stream(yield_dongle):
+    chain_id = 1
+    txdata = os.urandom(1024)
+
+    with yield_dongle() as dongle:
+        tx = Transaction(
+            destination=decode_hex("0xf0155486a14539f784739be1c02e93f28eb8e960"),
+            amount=int(1e17),
+            gas_limit=int(1e6),
+            gas_price=int(1e9),
+            data=txdata,
+            nonce=1234,
+            chain_id=chain_id,
+        )
+        encoded_tx = rlp.encode(tx, Transaction)
+        payload = (
+            (len(DEFAULT_PATH_ENCODED) // 4).to_bytes(1, "big")
+            + DEFAULT_PATH_ENCODED
+            + encoded_tx
+        )
+
+        retval = dongle_send_data_stream(
+            dongle, "SIGN_TX_FIRST_DATA", "SIGN_TX_SECONDARY_DATA", payload
+        )
+
+        assert len(retval) == 65
+        assert retval[0] in [(chain_id * 2 + 35) + x for x in (0, 1)]
+
+
 # def test_comms_sign_small_message(yield_dongle): pass
 
 
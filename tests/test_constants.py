@@ -0,0 +1,37 @@
+from ledgereth.constants import getenvint
+
+
+def test_getenvint(monkeypatch):
+    """Test getenvint() reads the given env var"""
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "42")
+    monkeypatch.delenv("MAX_ACCOUNTS_FETCH", raising=False)
+
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 42
+
+
+def test_getenvint_default(monkeypatch):
+    """Test getenvint() falls back to the default"""
+    monkeypatch.delenv("LEDGERETH_TEST_INT", raising=False)
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 5
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "five")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 5
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 5
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "-1")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == -1
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "+7")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 7
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", " 7 ")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 7
+
+    # These pass str.isdigit() but int() can't parse them
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "--5")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 5
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "²")
+    assert getenvint("LEDGERETH_TEST_INT", 5) == 5
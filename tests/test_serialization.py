@@ -1,11 +1,18 @@
 """
 Test objects and serialization
 """
+
+import pytest
+import rlp
 from eth_utils import decode_hex, is_checksum_address
 
-from ledgereth.constants import DEFAULT_CHAIN_ID, DEFAULTS
+from ledgereth import objects
+from ledgereth.constants import DEFAULT_CHAIN_ID
 from ledgereth.objects import (
+    ISO7816Command,
     LedgerAccount,
+    SerializableTransaction,
+    SignedMessage,
     SignedTransaction,
     SignedType1Transaction,
     SignedType2Transaction,
@@ -28,11 +35,35 @@ def test_account():
     assert alice.path != bob.path
     assert alice.path_encoded != bob.path_encoded
     assert alice != bob
+    assert alice == LedgerAccount(alice.path, alice.address)
+    assert alice != alice.address
     assert hash(alice) != hash(bob)
+    assert hash(alice) == hash(alice)
+    assert {alice: 1}[LedgerAccount(alice.path, alice.address)] == 1
     assert is_checksum_address(alice.address)
     assert is_checksum_address(bob.address)
 
 
+def test_iso7816_command():
+    """Test ISO7816Command encoding is kept in sync with its parts"""
+    cmd = ISO7816Command(CLA=b"\xe0", INS=b"\x02", P1=b"\x00", P2=b"\x00")
+
+    assert cmd.encode() == b"\xe0\x02\x00\x00\x00"
+
+    cmd.set_data(b"\xde\xad")
+    assert cmd.encode() == b"\xe0\x02\x00\x00\x02\xde\xad"
+
+    cmd.Le = b"\x00"
+    assert cmd.encode() == b"\xe0\x02\x00\x00\x02\xde\xad\x00"
+    assert cmd.encode_hex() == "e002000002dead00"
+
+    # An explicit Lc is kept even when data is given
+    cmd = ISO7816Command(
+        CLA=b"\xe0", INS=b"\x02", P1=b"\x00", P2=b"\x00", Lc=b"\x01", data=b"\xde"
+    )
+    assert cmd.Lc == b"\x01"
+
+
 def test_legacy_serialization(yield_dongle):
     """Test serialization of legacy Transaction objects"""
     destination = decode_hex("0xf0155486a14539f784739be1c02e93f28eb8e960")
@@ -58,8 +89,21 @@ def test_legacy_serialization(yield_dongle):
     assert tx.amount == amount
     assert tx.data == data
     assert tx.chain_id == DEFAULT_CHAIN_ID
-    assert tx.dummy1 == DEFAULTS[int]
-    assert tx.dummy2 == DEFAULTS[int]
+
+    # The encoding is the nine element EIP-155 signing pre-image
+    encoded = rlp.encode(tx)
+    assert rlp.decode(encoded)[-3:] == [b"\x01", b"", b""]
+    assert rlp.decode(encoded, Transaction) == tx
+    assert Transaction.from_rawtx(encoded) == tx
+
+    # Signed legacy txs have v, r, s in place of the trailer
+    signed = rlp.encode([1, 2, 3, b"\x11" * 20, 5, b"", 37, 12345, 67890])
+
+    with pytest.raises(rlp.DeserializationError):
+        rlp.decode(signed, Transaction)
+
+    with pytest.raises(rlp.DeserializationError):
+        Transaction.from_rawtx(signed)
 
 
 def test_signed_legacy_serialization(yield_dongle):
@@ -103,6 +147,14 @@ def test_signed_legacy_serialization(yield_dongle):
     assert tx.v == v
     assert tx.raw_transaction()
 
+    decoded = SignedTransaction.from_rawtx(decode_hex(tx.raw_transaction()))
+
+    assert decoded.destination == destination
+    assert decoded.data == data
+    assert decoded.v == v
+    assert decoded.r == r
+    assert decoded.s == s
+
 
 def test_type1_serialization(yield_dongle):
     """Test serialization of Type1Transaction objects"""
@@ -280,3 +332,174 @@ def test_signed_type2_serialization(yield_dongle):
     assert tx.access_list[0][0] == destination
     assert len(tx.access_list[0][1]) == len(access_list[0][1])
     assert tx.raw_transaction()
+
+
+def test_to_dict():
+    """Test conversion of transactions to dicts keyed by field name"""
+    destination = decode_hex("0xf0155486a14539f784739be1c02e93f28eb8e960")
+
+    tx = Type1Transaction(
+        chain_id=DEFAULT_CHAIN_ID,
+        nonce=1,
+        gas_price=int(1e9),
+        gas_limit=21000,
+        destination=destination,
+        amount=2,
+        data=b"",
+        access_list=[],
+    )
+
+    assert tx.to_dict() == {
+        "chain_id": DEFAULT_CHAIN_ID,
+        "nonce": 1,
+        "gas_price": int(1e9),
+        "gas_limit": 21000,
+        "destination": destination,
+        "amount": 2,
+        "data": b"",
+        "access_list": (),
+    }
+
+    # attrgetter() with one attribute doesn't return a tuple
+    class OneField(SerializableTransaction):
+        fields = [("nonce", rlp.sedes.big_endian_int)]
+
+        @classmethod
+        def from_rawtx(cls, rawtx):
+            return rlp.decode(rawtx, cls)
+
+    assert OneField(nonce=7).to_dict() == {"nonce": 7}
+
+
+def test_to_rpc_dict():
+    """Test conversion of transactions to web3.py/JSON-RPC dicts"""
+    destination = decode_hex("0xf0155486a14539f784739be1c02e93f28eb8e960")
+
+    tx = Transaction(
+        destination=destination,
+        amount=int(1e17),
+        gas_limit=int(1e6),
+        gas_price=int(1e9),
+        data=b"",
+        nonce=666,
+    )
+
+    assert tx.to_rpc_dict() == {
+        "nonce": 666,
+        "gasPrice": int(1e9),
+        "gas": int(1e6),
+        "to": destination,
+        "value": int(1e17),
+        "data": b"",
+        "chainId": DEFAULT_CHAIN_ID,
+    }
+
+    tx2 = Type2Transaction.from_rawtx(
+        b"\x02"
+        + rlp.encode(
+            Type2Transaction(
+                chain_id=DEFAULT_CHAIN_ID,
+                destination=destination,
+                amount=int(1e17),
+                gas_limit=int(1e6),
+                max_fee_per_gas=int(10e9),
+                max_priority_fee_per_gas=int(1e9),
+                data=b"",
+                nonce=666,
+                access_list=[[destination, [10, 200]]],
+            )
+        )
+    )
+    rpc_dict = tx2.to_rpc_dict()
+
+    assert rpc_dict["maxFeePerGas"] == int(10e9)
+    assert rpc_dict["maxPriorityFeePerGas"] == int(1e9)
+    assert rpc_dict["accessList"] == [
+        {
+            "address": destination,
+            "storageKeys": [
+                "0x" + (10).to_bytes(32, "big").hex(),
+                "0x" + (200).to_bytes(32, "big").hex(),
+            ],
+        }
+    ]
+
+    # Storage keys can still be ints on a transaction that wasn't decoded
+    tx3 = Type2Transaction(
+        chain_id=DEFAULT_CHAIN_ID,
+        destination=destination,
+        amount=int(1e17),
+        gas_limit=int(1e6),
+        max_fee_per_gas=int(10e9),
+        max_priority_fee_per_gas=int(1e9),
+        data=b"",
+        nonce=666,
+        access_list=[[destination, [10, 200]]],
+    )
+
+    assert tx3.to_rpc_dict()["accessList"] == rpc_dict["accessList"]
+
+
+def test_to_rpc_dict_overrides(monkeypatch):
+    """Test custom to_rpc_dict methods survive subclassing"""
+    compiled = []
+    compile_to_rpc_dict = objects._compile_to_rpc_dict
+
+    def recording_compile(cls):
+        compiled.append(cls)
+        return compile_to_rpc_dict(cls)
+
+    monkeypatch.setattr(objects, "_compile_to_rpc_dict", recording_compile)
+
+    class Custom(Type2Transaction):
+        def to_rpc_dict(self):
+            return {**super().to_rpc_dict(), "custom": True}
+
+    class Inherited(Custom):
+        pass
+
+    tx = Inherited(
+        chain_id=DEFAULT_CHAIN_ID,
+        destination=b"",
+        amount=0,
+        gas_limit=21000,
+        max_fee_per_gas=2,
+        max_priority_fee_per_gas=1,
+        data=b"",
+        nonce=0,
+        access_list=[],
+    )
+
+    assert Inherited.to_rpc_dict is Custom.to_rpc_dict
+    assert tx.to_rpc_dict()["custom"] is True
+
+    # super() reaches the parent's generated version
+    assert tx.to_rpc_dict() == tx.to_rpc_dict()
+    assert compiled == []
+
+    # The generic fallback is only generated once per class
+    fallback = SerializableTransaction.to_rpc_dict
+    assert fallback(tx) == fallback(tx)
+    assert compiled == [Inherited]
+
+
+def test_signed_message_signature():
+    """Test signature encoding, including zero values"""
+    signed = SignedMessage(b"test", 0, 1, 2)
+
+    assert signed.signature == "0x" + "00" * 31 + "01" + "00" * 31 + "02" + "00"
+
+    with pytest.raises(ValueError):
+        SignedMessage(b"test", None, 1, 2).signature
+
+
+def test_slotted_objects():
+    """Test that the plain wrapper objects don't carry an instance __dict__"""
+    account = LedgerAccount("44'/60'/0'/0/0", "0x" + "00" * 20)
+    signed = SignedMessage(b"hello", 27, 1, 2)
+
+    for obj in (account, signed):
+        assert not hasattr(obj, "__dict__")
+
+    with pytest.raises(AttributeError):
+        signed.extra = True
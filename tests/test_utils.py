@@ -1,5 +1,8 @@
+import pytest
+
 from ledgereth.constants import DEFAULT_PATH_ENCODED, DEFAULT_PATH_STRING
 from ledgereth.utils import (
+    coerce_list_types,
     decode_bip32_path,
     is_bip32_path,
     is_bytes,
@@ -21,6 +24,11 @@ def test_is_hex_string():
 def test_is_bip32_path():
     """Test is_bip32_path() against a known constant"""
     assert is_bip32_path(DEFAULT_PATH_STRING)
+    assert is_bip32_path("44'/60'/0'/0")
+    assert not is_bip32_path("")
+    assert not is_bip32_path("m/44'/60'/0'/0/0")
+    assert not is_bip32_path("44'/60'/0'/0/-1")
+    assert not is_bip32_path("44'/60'/2147483648'/0/0")
 
 
 def test_path_encoding():
@@ -29,3 +37,27 @@ def test_path_encoding():
     assert encoded == DEFAULT_PATH_ENCODED
     decoded = decode_bip32_path(encoded)
     assert decoded == DEFAULT_PATH_STRING
+
+
+def test_path_encoding_invalid():
+    """Test that parse_bip32_path() rejects invalid paths"""
+    with pytest.raises(ValueError):
+        parse_bip32_path("44'/60'/0'/0/x")
+
+    # Index would overflow into the hardened bit
+    with pytest.raises(ValueError):
+        parse_bip32_path("44'/60'/0'/0/2147483648")
+
+
+def test_coerce_list_types():
+    """Test coerce_list_types() with skipped and empty values"""
+    access_list = [[b"\x01" * 20, []]]
+
+    assert coerce_list_types(
+        (int, bytes, None, int), [b"\x01\x00", b"", access_list, b""]
+    ) == [256, b"", access_list, 0]
+    # Lists of types are accepted as well as tuples
+    assert coerce_list_types([int], [b"\x2a"]) == [42]
+    # Falsy values become the type's default
+    assert coerce_list_types([int, bytes], [None, None]) == [0, b""]
+    assert coerce_list_types([int], [0]) == [0]
@@ -1,9 +1,17 @@
+import asyncio
+import threading
+from collections import OrderedDict
+
+import pytest
 from eth_account import Account
 from eth_account.messages import encode_defunct, encode_structured_data
 from eth_utils import encode_hex
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.datastructures import AttributeDict
-from web3.providers.eth_tester import EthereumTesterProvider
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
 from web3.providers.eth_tester.defaults import API_ENDPOINTS, static_return
 from web3.types import TxReceipt, Wei
 
@@ -16,8 +24,16 @@ from ledgereth.utils import (
     is_hex_string,
     parse_bip32_path,
 )
-from ledgereth.web3 import LedgerSignerMiddleware
+from ledgereth.web3 import (
+    INTERCEPTED_METHODS,
+    AsyncLedgerSignerMiddleware,
+    LedgerSignerMiddleware,
+    _fee_args,
+    _hash_typed_data,
+    _hex_to_int,
+)
 
+from .conftest import MockDongle
 from .fixtures import eip712_dict
 
 
@@ -299,3 +315,345 @@ def test_web3_middleware_sign_typed_data(yield_dongle):
         res = web3.eth.sign_typed_data(signer.address, eip712_dict)
 
         assert signer.address == Account.recover_message(signable, signature=res)
+
+
+def test_web3_middleware_account_cache(yield_dongle, monkeypatch):
+    """Test LedgerSignerMiddleware only derives accounts from the device once"""
+    with yield_dongle() as dongle:
+        account = get_accounts(dongle)[0]
+        lookups = []
+
+        def find_account(address, dongle=None):
+            lookups.append(address)
+            return account
+
+        monkeypatch.setattr("ledgereth.web3.find_account", find_account)
+        middleware = LedgerSignerMiddleware(None, None)
+
+        assert middleware._find_account(account.address) is account
+        assert middleware._find_account(account.address.lower()) is account
+        assert len(lookups) == 1
+
+        middleware.clear_account_cache()
+
+        assert middleware._find_account(account.address) is account
+        assert len(lookups) == 2
+
+
+def test_web3_middleware_batch_nonces(yield_dongle, monkeypatch):
+    """Test LedgerSignerMiddleware fetches the chain ID once and nonces once per
+    batch"""
+    calls = []
+
+    class MockEth:
+        @property
+        def chain_id(self):
+            calls.append("chain_id")
+            return 1
+
+        def get_transaction_count(self, address):
+            calls.append("get_transaction_count")
+            return 5 if address == sender.address else 20
+
+    class MockWeb3:
+        eth = MockEth()
+
+    def create_transaction(**kwargs):
+        return AttributeDict({"rawTransaction": kwargs["nonce"]})
+
+    def make_request(method, params):
+        return {"method": method, "params": params}
+
+    monkeypatch.setattr("ledgereth.web3.create_transaction", create_transaction)
+
+    with yield_dongle() as dongle:
+        sender = get_accounts(dongle)[0]
+        middleware = LedgerSignerMiddleware(make_request, MockWeb3())
+        middleware._dongle = dongle
+        tx = {"from": sender.address, "gas": "0x5208", "gasPrice": "0x1"}
+
+        assert middleware("eth_sendTransaction", [tx, tx, tx]) == {
+            "method": "eth_sendRawTransaction",
+            "params": [5, 6, 7],
+        }
+        assert calls == ["chain_id", "get_transaction_count"]
+
+        # Explicit nonces come through as hex quantities
+        assert middleware("eth_sendTransaction", [{**tx, "nonce": "0x9"}]) == {
+            "method": "eth_sendRawTransaction",
+            "params": [9],
+        }
+
+        # Lone transactions skip the batch bookkeeping
+        with monkeypatch.context() as m:
+            m.setattr(middleware, "_sender_accounts", None)
+            assert middleware("eth_sendTransaction", [tx]) == {
+                "method": "eth_sendRawTransaction",
+                "params": [5],
+            }
+
+        # Each sender in a batch gets its own nonce sequence
+        calls.clear()
+        other = get_accounts(dongle, count=2)[1]
+        other_tx = {**tx, "from": other.address}
+
+        assert middleware("eth_sendTransaction", [tx, other_tx, tx, other_tx]) == {
+            "method": "eth_sendRawTransaction",
+            "params": [5, 20, 6, 21],
+        }
+        # The chain ID is remembered from the first batch
+        assert calls == ["get_transaction_count", "get_transaction_count"]
+
+        middleware.clear_chain_id_cache()
+        middleware("eth_sendTransaction", [{**tx, "nonce": "0x9"}])
+        assert calls[-1] == "chain_id"
+
+        # Nothing is signed if any transaction in the batch is invalid
+        with pytest.raises(ValueError, match='"gas" field not provided'):
+            middleware("eth_sendTransaction", [tx, {**tx, "gas": None}])
+
+        # Every missing field is reported at once
+        with pytest.raises(
+            ValueError,
+            match='^"from", "gasPrice" or "maxFeePerGas" fields not provided$',
+        ):
+            middleware("eth_sendTransaction", [{"gas": "0x5208"}])
+
+
+def test_web3_async_middleware_batch(yield_dongle, monkeypatch):
+    """Test AsyncLedgerSignerMiddleware validates a batch up front and tracks
+    nonces per sender"""
+    calls = []
+    signed = []
+
+    class MockEth:
+        @property
+        async def chain_id(self):
+            calls.append("chain_id")
+            return 1
+
+        async def get_transaction_count(self, address):
+            calls.append("get_transaction_count")
+            return 5 if address == sender.address else 20
+
+    class MockWeb3:
+        eth = MockEth()
+
+    def create_transaction(**kwargs):
+        signed.append(kwargs["nonce"])
+        return AttributeDict({"rawTransaction": kwargs["nonce"]})
+
+    async def make_request(method, params):
+        return {"method": method, "params": params}
+
+    monkeypatch.setattr("ledgereth.web3.create_transaction", create_transaction)
+
+    async def run(middleware):
+        tx = {"from": sender.address, "gas": "0x5208", "gasPrice": "0x1"}
+        other_tx = {**tx, "from": other.address}
+
+        assert await middleware(
+            "eth_sendTransaction", [tx, other_tx, {**tx, "nonce": "0x9"}, tx]
+        ) == {
+            "method": "eth_sendRawTransaction",
+            "params": [5, 20, 9, 6],
+        }
+        assert calls == ["chain_id", "get_transaction_count", "get_transaction_count"]
+
+        # Nothing is signed if any transaction in the batch is invalid
+        signed.clear()
+
+        with pytest.raises(ValueError, match='"gas" field not provided'):
+            await middleware("eth_sendTransaction", [tx, {**tx, "gas": None}])
+
+        assert signed == []
+
+    with yield_dongle() as dongle:
+        sender, other = get_accounts(dongle, count=2)[:2]
+        middleware = AsyncLedgerSignerMiddleware(make_request, MockWeb3())
+        middleware._dongle = dongle
+
+        asyncio.run(run(middleware))
+
+
+def test_web3_async_middleware(yield_dongle):
+    """Test AsyncLedgerSignerMiddleware with AsyncWeb3"""
+    text_message = "AsyncLedgerSignerMiddleware"
+    provider = AsyncEthereumTesterProvider()
+    web3 = AsyncWeb3(provider)
+    clean_web3 = AsyncWeb3(provider)
+
+    async def run(dongle):
+        web3.middleware_onion.add(AsyncLedgerSignerMiddleware, "ledgereth_middleware")
+        ledgereth_middleware = web3.middleware_onion.get("ledgereth_middleware")
+
+        # Set to the test dongle to make sure it's not using the default dongle
+        ledgereth_middleware._dongle = dongle
+
+        signer = get_accounts(dongle)[0]
+
+        assert signer.address in await web3.eth.accounts
+
+        res = await web3.eth.sign(signer.address, text=text_message)
+
+        assert signer.address == Account.recover_message(
+            encode_defunct(text=text_message), signature=res
+        )
+
+        # Fund the Ledger account and send a transaction from it
+        alice_address = (await clean_web3.eth.accounts)[0]
+        await clean_web3.eth.wait_for_transaction_receipt(
+            await clean_web3.eth.send_transaction(
+                {
+                    "from": alice_address,
+                    "to": signer.address,
+                    "value": int(1e18),
+                    "gas": 21000,
+                    "gasPrice": int(5e9),
+                }
+            )
+        )
+        tx = await web3.eth.send_transaction(
+            {
+                "from": signer.address,
+                "to": alice_address,
+                "value": int(0.25e18),
+                "gas": 21000,
+                "maxFeePerGas": int(5e9),
+                "maxPriorityFeePerGas": int(1e8),
+            }
+        )
+        receipt = await web3.eth.wait_for_transaction_receipt(tx)
+
+        assert receipt.status == 1
+        assert receipt["from"] == signer.address
+
+    with yield_dongle() as dongle:
+        asyncio.run(run(dongle))
+
+
+def test_web3_middleware_reuses_dongle(monkeypatch):
+    """Test LedgerSignerMiddleware opens the device once and can close it"""
+    opened = []
+
+    class ClosableMockDongle(MockDongle):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def get_dongle(debug=False):
+        opened.append(ClosableMockDongle())
+        return opened[-1]
+
+    monkeypatch.setattr("ledgereth.comms.getDongle", get_dongle)
+    # Other tests inject a dongle at the class level
+    monkeypatch.setattr(LedgerSignerMiddleware, "_dongle", None)
+    middleware = LedgerSignerMiddleware(None, None)
+
+    assert middleware._get_dongle() is middleware._get_dongle()
+    assert len(opened) == 1
+
+    # A connected and verified session doesn't need the lock
+    lock = middleware._dongle_lock
+    middleware._dongle_lock = None
+    assert middleware._get_dongle() is opened[0]
+    middleware._dongle_lock = lock
+
+    middleware.close()
+
+    assert opened[0].closed
+    assert middleware._get_dongle() is opened[1]
+
+
+def test_hex_to_int():
+    """Test conversion of JSON-RPC quantities"""
+    assert _hex_to_int("0x5208") == 21000
+    assert _hex_to_int(21000) == 21000
+    assert _hex_to_int("0x0") == 0
+    assert _hex_to_int(None) is None
+
+
+def test_fee_args():
+    """Test only the fee fields used by a transaction's shape are converted"""
+    assert _fee_args({"gasPrice": "0x1"}) == {"gas_price": 1}
+    assert _fee_args({"maxFeePerGas": "0x2", "maxPriorityFeePerGas": "0x1"}) == {
+        "max_fee_per_gas": 2,
+        "max_priority_fee_per_gas": 1,
+    }
+    assert _fee_args({"maxFeePerGas": "0x2"}) == {
+        "max_fee_per_gas": 2,
+        "max_priority_fee_per_gas": None,
+    }
+
+    # Mixed shapes are passed through for create_transaction() to reject
+    assert _fee_args({"gasPrice": "0x1", "maxFeePerGas": "0x2"}) == {
+        "gas_price": 1,
+        "max_fee_per_gas": 2,
+        "max_priority_fee_per_gas": None,
+    }
+
+
+def test_hash_typed_data_cache(monkeypatch):
+    """Test typed data hashes are remembered between signings"""
+    signable = encode_structured_data(eip712_dict)
+    encoded = []
+
+    def encode(typed_data):
+        encoded.append(typed_data)
+        return signable
+
+    monkeypatch.setattr("eth_account.messages.encode_structured_data", encode)
+    monkeypatch.setattr("ledgereth.web3._typed_data_cache", OrderedDict())
+
+    assert _hash_typed_data(eip712_dict) == (signable.header, signable.body)
+    assert _hash_typed_data(eip712_dict) == (signable.header, signable.body)
+    assert len(encoded) == 1
+
+    # Payloads JSON can't tell apart from another aren't cached
+    int_keys = {**eip712_dict, "extra": {1: "one"}}
+    str_keys = {**eip712_dict, "extra": {"1": "one"}}
+    as_tuple = {**eip712_dict, "extra": ("one",)}
+    as_list = {**eip712_dict, "extra": ["one"]}
+
+    for typed_data in (str_keys, int_keys, as_list, as_tuple):
+        _hash_typed_data(typed_data)
+
+    assert encoded[1:] == [str_keys, int_keys, as_list, as_tuple]
+
+
+def test_web3_middleware_typed_data_overlap(yield_dongle, monkeypatch):
+    """Test typed data is hashed alongside an account lookup on the device"""
+    hash_threads = []
+    hash_typed_data = _hash_typed_data
+
+    def recording_hash_typed_data(typed_data):
+        hash_threads.append(threading.current_thread())
+        return hash_typed_data(typed_data)
+
+    monkeypatch.setattr("ledgereth.web3._hash_typed_data", recording_hash_typed_data)
+
+    with yield_dongle() as dongle:
+        signer = get_accounts(dongle)[0]
+        middleware = LedgerSignerMiddleware(None, None)
+        middleware._dongle = dongle
+        params = [signer.address, eip712_dict]
+
+        signature = middleware("eth_signTypedData", params)["result"]
+        assert hash_threads[-1] is not threading.current_thread()
+
+        # Known accounts don't need the device, so there's nothing to overlap
+        assert middleware("eth_signTypedData", params)["result"] == signature
+        assert hash_threads[-1] is threading.current_thread()
+
+
+def test_web3_middleware_passthrough():
+    """Test LedgerSignerMiddleware passes on methods it doesn't intercept"""
+    middleware = LedgerSignerMiddleware(lambda method, params: method, None)
+
+    # Every intercepted method has a handler, sync and async
+    for cls in (LedgerSignerMiddleware, AsyncLedgerSignerMiddleware):
+        for method in INTERCEPTED_METHODS:
+            assert callable(getattr(cls, cls._HANDLERS[method]))
+
+    assert middleware("eth_chainId", []) == "eth_chainId"